@@ -32,7 +32,7 @@ async def list_agents(
     try:
         agents = await orchestrator.list_agents()
         
-        return AgentListResponse(
+        return AgentListResponse.model_construct(
             success=True,
             agents=agents,
             total_count=len(agents)
@@ -66,7 +66,7 @@ async def create_agent(
             config=request.config
         )
         
-        return AgentResponse(
+        return AgentResponse.model_construct(
             success=True,
             agent=agent.to_dict()
         )
@@ -100,7 +100,7 @@ async def submit_task(
         
         task = await orchestrator.submit_task(task_request)
         
-        return TaskResponse(
+        return TaskResponse.model_construct(
             success=True,
             task=task.to_dict()
         )
@@ -128,7 +128,7 @@ async def get_task_status(
     try:
         task = await orchestrator.get_task_status(task_id)
         
-        return TaskStatusResponse(
+        return TaskStatusResponse.model_construct(
             success=True,
             task=task.to_dict()
         )
@@ -12,16 +12,17 @@ from api.schemas.settings import (
     ApiKeyValidationRequest, ApiKeyValidationResponse, SettingsApplyResponse
 )
 from infrastructure.storage.user_settings_storage import UserSettingsStorage
-from core.security import APIKeyManager
+from core.security import get_api_key_manager
 from core.config import get_settings, Settings
 from core.api_key_resolver import get_api_key_resolver
+from core.dependencies import clear_chat_response_cache
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 logger = logging.getLogger(__name__)
 
 # Initialize services
 settings_storage = UserSettingsStorage()
-api_key_manager = APIKeyManager()
+api_key_manager = get_api_key_manager()
 
 
 # ==================== Shared Validation Functions ====================
@@ -240,6 +241,9 @@ async def update_settings(request: SettingsUpdateRequest):
         # Save settings
         await settings_storage.save_settings(request.settings)
         
+        # Cached chat answers may depend on the previous RAG settings
+        clear_chat_response_cache()
+        
         logger.info(f"Settings updated successfully (mode: {request.settings.api_keys.mode if request.settings.api_keys else 'default'})")
         
         return SettingsResponse(
@@ -5,7 +5,7 @@ Handles resolution of API keys with strict mode enforcement (no automatic fallba
 import logging
 from typing import Optional, Dict, Any
 
-from core.security import APIKeyManager
+from core.security import get_api_key_manager
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ class APIKeyResolver:
     
     def __init__(self):
         """Initialize API key resolver with encryption manager"""
-        self.api_key_manager = APIKeyManager()
+        self.api_key_manager = get_api_key_manager()
     
     def resolve_openai_key(
         self,
@@ -24,6 +24,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 from typing import Optional
 from pathlib import Path
+import functools
 import os
 import platform
 
@@ -51,63 +52,66 @@ class Settings(BaseSettings):
     """Main application settings - all fields at top level for proper .env loading"""
     
     # Pydantic Settings v2 configuration
+    # Env var names are the upper-cased field names (case_sensitive=False),
+    # so fields only need an explicit alias when the names differ
     model_config = SettingsConfigDict(
         env_file=str(Path(__file__).parent.parent / ".env"),
         env_file_encoding='utf-8',
         case_sensitive=False,
-        extra='ignore'
+        extra='ignore',
+        frozen=True
     )
     
     # App metadata
     app_name: str = "Covenantrix"
     version: str = "1.2.6"
-    environment: str = Field("development", env="ENVIRONMENT")
+    environment: str = "development"
     
     # Database configuration
-    postgres_host: str = Field("localhost", env="POSTGRES_HOST")
-    postgres_port: int = Field(5432, env="POSTGRES_PORT")
-    postgres_db: str = Field("covenantrix_db", env="POSTGRES_DB")
-    postgres_user: str = Field("covenantrix_user", env="POSTGRES_USER")
-    postgres_password: Optional[str] = Field(None, env="POSTGRES_PASSWORD")
+    postgres_host: str = "localhost"
+    postgres_port: int = 5432
+    postgres_db: str = "covenantrix_db"
+    postgres_user: str = "covenantrix_user"
+    postgres_password: Optional[str] = None
     
     # OpenAI configuration
     # Note: API key resolution happens via api_key_resolver.py
     # This is the system fallback key from .env
-    openai_api_key: Optional[str] = Field(None, env="OPENAI_API_KEY")
-    openai_model: str = Field("gpt-4o-mini", env="OPENAI_MODEL")
-    openai_embedding_model: str = Field("text-embedding-3-large", env="OPENAI_EMBEDDING_MODEL")
-    openai_max_tokens: int = Field(4000, env="OPENAI_MAX_TOKENS")
-    openai_temperature: float = Field(0.7, env="OPENAI_TEMPERATURE")
+    openai_api_key: Optional[str] = None
+    openai_model: str = "gpt-4o-mini"
+    openai_embedding_model: str = "text-embedding-3-large"
+    openai_max_tokens: int = 4000
+    openai_temperature: float = 0.7
     
     # Cohere configuration (for reranking)
     # Note: API key resolution happens via api_key_resolver.py
     # This is the system fallback key from .env
-    cohere_api_key: Optional[str] = Field(None, env="COHERE_API_KEY")
+    cohere_api_key: Optional[str] = None
     
     # Storage configuration
-    storage_working_dir: Path = Field(default_factory=lambda: get_user_data_directory() / "rag_storage", env="STORAGE_WORKING_DIR")
-    storage_analytics_file: str = Field("analytics_metadata.json", env="ANALYTICS_FILE")
-    storage_max_file_size_mb: int = Field(50, env="MAX_FILE_SIZE_MB")
+    storage_working_dir: Path = Field(default_factory=lambda: get_user_data_directory() / "rag_storage")
+    storage_analytics_file: str = "analytics_metadata.json"
+    storage_max_file_size_mb: int = 50
     
     # Server configuration
-    server_host: str = Field("127.0.0.1", env="SERVER_HOST")
-    server_port: int = Field(8000, env="SERVER_PORT")
-    server_debug: bool = Field(False, env="DEBUG")
-    server_reload: bool = Field(False, env="RELOAD")
-    server_workers: int = Field(1, env="WORKERS")
+    server_host: str = "127.0.0.1"
+    server_port: int = 8000
+    server_debug: bool = False
+    server_reload: bool = False
+    server_workers: int = 1
     
     # Google Vision configuration
     # Note: API key resolution happens via api_key_resolver.py
     # This is the system fallback key from .env
-    google_api_key: Optional[str] = Field(None, env="GOOGLE_API_KEY")
-    google_vision_enabled: bool = Field(False, env="GOOGLE_VISION_ENABLED")
-    google_vision_project_id: Optional[str] = Field(None, env="GOOGLE_VISION_PROJECT_ID")
+    google_api_key: Optional[str] = None
+    google_vision_enabled: bool = False
+    google_vision_project_id: Optional[str] = None
     
     # OCR Settings
-    ocr_enabled: bool = Field(True, env="OCR_ENABLED")
-    ocr_min_confidence: float = Field(0.3, env="OCR_MIN_CONFIDENCE")
-    ocr_min_char_count: int = Field(5, env="OCR_MIN_CHAR_COUNT")
-    ocr_preferred_language: Optional[str] = Field(None, env="OCR_PREFERRED_LANGUAGE")  # None = auto-detect
+    ocr_enabled: bool = True
+    ocr_min_confidence: float = 0.3
+    ocr_min_char_count: int = 5
+    ocr_preferred_language: Optional[str] = None  # None = auto-detect
     
     # Google OAuth configuration
     google_oauth_client_id: Optional[str] = Field(default=None, validation_alias="GOOGLE_CLIENT_ID")
@@ -115,10 +119,10 @@ class Settings(BaseSettings):
     google_oauth_redirect_uri: str = Field(default="http://localhost:8000/api/google/accounts/callback", validation_alias="GOOGLE_REDIRECT_URI")
     
     # External API configuration
-    numbeo_api_key: Optional[str] = Field(None, env="NUMBEO_API_KEY")
-    osm_nominatim_base_url: str = Field("https://nominatim.openstreetmap.org", env="OSM_NOMINATIM_BASE_URL")
-    eurostat_api_base_url: str = Field("https://ec.europa.eu/eurostat/api", env="EUROSTAT_API_BASE_URL")
-    google_maps_api_key: Optional[str] = Field(None, env="GOOGLE_MAPS_API_KEY")
+    numbeo_api_key: Optional[str] = None
+    osm_nominatim_base_url: str = "https://nominatim.openstreetmap.org"
+    eurostat_api_base_url: str = "https://ec.europa.eu/eurostat/api"
+    google_maps_api_key: Optional[str] = None
     
     @field_validator("storage_working_dir", mode="before")
     @classmethod
@@ -131,7 +135,8 @@ class Settings(BaseSettings):
         return path
     
     # Property accessors for nested config compatibility
-    @property
+    # Settings is frozen, so each accessor is built once per instance
+    @functools.cached_property
     def database(self):
         """Database configuration accessor"""
         class DatabaseConfig:
@@ -150,7 +155,7 @@ class Settings(BaseSettings):
         
         return DatabaseConfig(self)
     
-    @property
+    @functools.cached_property
     def openai(self):
         """OpenAI configuration accessor"""
         class OpenAIConfig:
@@ -163,7 +168,7 @@ class Settings(BaseSettings):
         
         return OpenAIConfig(self)
     
-    @property
+    @functools.cached_property
     def cohere(self):
         """Cohere configuration accessor"""
         class CohereConfig:
@@ -172,7 +177,7 @@ class Settings(BaseSettings):
         
         return CohereConfig(self)
     
-    @property
+    @functools.cached_property
     def storage(self):
         """Storage configuration accessor"""
         class StorageConfig:
@@ -183,7 +188,7 @@ class Settings(BaseSettings):
         
         return StorageConfig(self)
     
-    @property
+    @functools.cached_property
     def server(self):
         """Server configuration accessor"""
         class ServerConfig:
@@ -196,7 +201,7 @@ class Settings(BaseSettings):
         
         return ServerConfig(self)
     
-    @property
+    @functools.cached_property
     def google_vision(self):
         """Google Vision configuration accessor"""
         class GoogleVisionConfig:
@@ -207,7 +212,7 @@ class Settings(BaseSettings):
         
         return GoogleVisionConfig(self)
     
-    @property
+    @functools.cached_property
     def ocr(self):
         """OCR configuration accessor"""
         class OCRConfig:
@@ -219,7 +224,7 @@ class Settings(BaseSettings):
         
         return OCRConfig(self)
     
-    @property
+    @functools.cached_property
     def google_oauth(self):
         """Google OAuth configuration accessor"""
         class GoogleOAuthConfig:
@@ -230,7 +235,7 @@ class Settings(BaseSettings):
         
         return GoogleOAuthConfig(self)
     
-    @property
+    @functools.cached_property
     def external_apis(self):
         """External APIs configuration accessor"""
         class ExternalAPIsConfig:
@@ -243,20 +248,13 @@ class Settings(BaseSettings):
         return ExternalAPIsConfig(self)
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@functools.cache
 def get_settings() -> Settings:
     """Get or create settings instance (singleton)"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reload_settings() -> Settings:
     """Force reload settings from environment"""
-    global _settings
-    _settings = Settings()
-    return _settings
\ No newline at end of file
+    get_settings.cache_clear()
+    return get_settings()
\ No newline at end of file
@@ -2,21 +2,28 @@
 FastAPI Dependency Injection
 Provides dependencies for route handlers
 """
+import asyncio
 import logging
+from pathlib import Path
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 
 from core.config import get_settings, Settings
+from core.api_key_resolver import get_api_key_resolver
 from core.exceptions import ConfigurationError
 from domain.documents.service import DocumentService
 from domain.analytics.service import AnalyticsService
-from domain.agents.orchestrator import AgentOrchestrator
+from domain.agents.orchestrator import AgentOrchestrator, AgentRegistry
+from domain.agents.market_research import MarketResearchAgent
 from domain.chat.service import ChatService
+from domain.chat.response_cache import ResponseCache
 from infrastructure.ai.rag_engine import RAGEngine
+from infrastructure.ai.openai_client import OpenAIClient
 from infrastructure.ai.agent_data_access import AgentDataAccessService
 from infrastructure.external.external_data_service import ExternalDataService
 from infrastructure.storage.lightrag_storage import LightRAGStorage
 from infrastructure.storage.analytics_storage import AnalyticsStorage
+from infrastructure.storage.extraction_cache import ExtractionCache
 from infrastructure.storage.document_registry import DocumentRegistry
 from infrastructure.storage.chat_storage import ChatStorage
 from infrastructure.storage.user_settings_storage import UserSettingsStorage
@@ -30,20 +37,33 @@ logger = logging.getLogger(__name__)
 
 # Global RAG engine instance (set during startup)
 _rag_engine_instance: Optional[RAGEngine] = None
+_reranker_available: bool = False
 
 # Global storage instances (manual singletons)
 _lightrag_storage: Optional[LightRAGStorage] = None
 _analytics_storage: Optional[AnalyticsStorage] = None
+_extraction_cache: Optional[ExtractionCache] = None
 _document_registry: Optional[DocumentRegistry] = None
 _chat_storage: Optional[ChatStorage] = None
-_agent_registry: Optional['AgentRegistry'] = None
+_chat_response_cache: Optional[ResponseCache] = None
+_agent_registry: Optional[AgentRegistry] = None
 _agent_data_access: Optional[AgentDataAccessService] = None
 _external_data_service: Optional[ExternalDataService] = None
 _ocr_service: Optional[OCRService] = None
+_ocr_service_key: Optional[int] = None
 _user_settings_storage: Optional[UserSettingsStorage] = None
 _oauth_service: Optional[GoogleOAuthService] = None
 _notification_storage: Optional[NotificationStorage] = None
 _subscription_service: Optional['SubscriptionService'] = None
+_subscription_document_service: Optional[DocumentService] = None
+_subscription_document_service_key: Optional[tuple] = None
+
+# 503 details for services that are set during startup
+_RAG_UNAVAILABLE_DETAIL = "RAG engine not initialized"
+_SUBSCRIPTION_UNAVAILABLE_DETAIL = "Subscription service not initialized"
+
+# Guards lazy singleton creation so concurrent first requests build one instance
+_init_lock = asyncio.Lock()
 
 
 def set_rag_engine(rag_engine: Optional[RAGEngine]) -> None:
@@ -53,8 +73,12 @@ def set_rag_engine(rag_engine: Optional[RAGEngine]) -> None:
     Args:
         rag_engine: Initialized RAG engine instance or None if unavailable
     """
-    global _rag_engine_instance
+    global _rag_engine_instance, _reranker_available
     _rag_engine_instance = rag_engine
+    # Capability is fixed per engine instance, so resolve it once here
+    _reranker_available = getattr(rag_engine, 'reranker', None) is not None
+    # Cached answers were produced by the previous engine
+    clear_chat_response_cache()
 
 
 def rag_engine_available() -> bool:
@@ -64,7 +88,6 @@ def rag_engine_available() -> bool:
     Returns:
         bool: True if RAG engine is initialized and available
     """
-    global _rag_engine_instance
     return _rag_engine_instance is not None
 
 
@@ -75,16 +98,7 @@ def reranker_available() -> bool:
     Returns:
         bool: True if Cohere is configured in RAG engine
     """
-    global _rag_engine_instance
-    if _rag_engine_instance is None:
-        return False
-    
-    try:
-        # Check if RAG engine has reranker configured
-        return hasattr(_rag_engine_instance, 'reranker') and _rag_engine_instance.reranker is not None
-    except Exception as e:
-        logger.error(f"Error checking reranker availability: {e}")
-        return False
+    return _reranker_available
 
 
 def ocr_service_available() -> bool:
@@ -94,7 +108,6 @@ def ocr_service_available() -> bool:
     Returns:
         bool: True if OCR service is initialized and available
     """
-    global _ocr_service
     return _ocr_service is not None
 
 
@@ -105,94 +118,123 @@ def set_ocr_service(ocr_service: Optional[OCRService]) -> None:
     Args:
         ocr_service: Initialized OCR service instance or None if unavailable
     """
-    global _ocr_service
+    global _ocr_service, _ocr_service_key
     _ocr_service = ocr_service
+    _ocr_service_key = None
 
 
 # Settings dependency
-def get_config() -> Settings:
+async def get_config() -> Settings:
     """Get application settings"""
     return get_settings()
 
 
 # Storage dependencies (manual singleton pattern)
-def get_lightrag_storage(
+async def get_lightrag_storage(
     settings: Settings = Depends(get_config)
 ) -> LightRAGStorage:
     """Get LightRAG storage instance (singleton)"""
     global _lightrag_storage
     if _lightrag_storage is None:
-        _lightrag_storage = LightRAGStorage(
-            working_dir=settings.storage.working_dir
-        )
+        async with _init_lock:
+            if _lightrag_storage is None:
+                _lightrag_storage = LightRAGStorage(
+                    working_dir=settings.storage.working_dir
+                )
     return _lightrag_storage
 
 
-def get_analytics_storage(
+async def get_analytics_storage(
     settings: Settings = Depends(get_config)
 ) -> AnalyticsStorage:
     """Get analytics storage instance (singleton)"""
     global _analytics_storage
     if _analytics_storage is None:
-        _analytics_storage = AnalyticsStorage()
+        async with _init_lock:
+            if _analytics_storage is None:
+                _analytics_storage = AnalyticsStorage()
     return _analytics_storage
 
 
-def get_document_registry(
+async def get_extraction_cache(
+    settings: Settings = Depends(get_config)
+) -> ExtractionCache:
+    """Get metadata extraction cache instance (singleton)"""
+    global _extraction_cache
+    if _extraction_cache is None:
+        async with _init_lock:
+            if _extraction_cache is None:
+                _extraction_cache = ExtractionCache(
+                    Path(settings.storage.working_dir) / "analytics_cache"
+                )
+    return _extraction_cache
+
+
+async def get_document_registry(
     settings: Settings = Depends(get_config)
 ) -> DocumentRegistry:
     """Get document registry instance (singleton)"""
     global _document_registry
     if _document_registry is None:
-        _document_registry = DocumentRegistry()
+        async with _init_lock:
+            if _document_registry is None:
+                _document_registry = DocumentRegistry()
     return _document_registry
 
 
-def get_chat_storage(
+async def get_chat_storage(
     settings: Settings = Depends(get_config)
 ) -> ChatStorage:
     """Get chat storage instance (singleton)"""
     global _chat_storage
     if _chat_storage is None:
-        _chat_storage = ChatStorage(settings.storage.working_dir)
+        async with _init_lock:
+            if _chat_storage is None:
+                _chat_storage = ChatStorage(settings.storage.working_dir)
     return _chat_storage
 
 
-def get_user_settings_storage(
+async def get_user_settings_storage(
     settings: Settings = Depends(get_config)
 ) -> UserSettingsStorage:
     """Get user settings storage instance (singleton)"""
     global _user_settings_storage
     if _user_settings_storage is None:
-        _user_settings_storage = UserSettingsStorage()
+        async with _init_lock:
+            if _user_settings_storage is None:
+                _user_settings_storage = UserSettingsStorage()
     return _user_settings_storage
 
 
-def get_notification_storage(
+async def get_notification_storage(
     settings: Settings = Depends(get_config)
 ) -> NotificationStorage:
     """Get notification storage instance (singleton)"""
     global _notification_storage
     if _notification_storage is None:
-        _notification_storage = NotificationStorage(settings.storage.working_dir)
+        async with _init_lock:
+            if _notification_storage is None:
+                _notification_storage = NotificationStorage(settings.storage.working_dir)
     return _notification_storage
 
 
-def get_notification_service(
+async def get_notification_service(
     storage: NotificationStorage = Depends(get_notification_storage)
 ) -> NotificationService:
     """Get notification service instance"""
     return NotificationService(storage=storage)
 
 
-def get_oauth_service(
+async def get_oauth_service(
     settings: Settings = Depends(get_config),
     storage: UserSettingsStorage = Depends(get_user_settings_storage)
 ) -> GoogleOAuthService:
     """Get Google OAuth service instance (singleton)"""
     global _oauth_service
     if _oauth_service is None:
-        _oauth_service = GoogleOAuthService(config=settings, storage=storage)
+        async with _init_lock:
+            if _oauth_service is None:
+                _oauth_service = GoogleOAuthService(config=settings, storage=storage)
     return _oauth_service
 
 
@@ -203,7 +245,7 @@ def reset_oauth_service() -> None:
     logger.debug("OAuth service singleton reset")
 
 
-def get_google_api_service(
+async def get_google_api_service(
     oauth_service: GoogleOAuthService = Depends(get_oauth_service)
 ) -> GoogleAPIService:
     """Get Google API service instance"""
@@ -222,25 +264,24 @@ def get_rag_engine() -> RAGEngine:
     Raises:
         HTTPException: If RAG engine not initialized
     """
-    global _rag_engine_instance
+    rag_engine = _rag_engine_instance
     
-    if _rag_engine_instance is None:
+    if rag_engine is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="RAG engine not initialized"
+            detail=_RAG_UNAVAILABLE_DETAIL
         )
     
-    return _rag_engine_instance
+    return rag_engine
 
 
-def get_ocr_service(
+async def get_ocr_service(
     settings: Settings = Depends(get_config)
 ) -> Optional[OCRService]:
     """
     Get OCR service instance (singleton)
     Returns global OCR service set during startup
     """
-    global _ocr_service
     return _ocr_service
 
 
@@ -252,11 +293,9 @@ def update_ocr_service_with_user_settings(user_settings: dict) -> None:
     Args:
         user_settings: User settings dictionary
     """
-    global _ocr_service
+    global _ocr_service, _ocr_service_key
     
     try:
-        from core.api_key_resolver import get_api_key_resolver
-        
         # Resolve Google API key using strict mode (no cross-mode fallback)
         api_key_resolver = get_api_key_resolver()
         settings = get_settings()
@@ -271,28 +310,44 @@ def update_ocr_service_with_user_settings(user_settings: dict) -> None:
         ocr_enabled = rag_settings.get("enable_ocr", True)
         
         if resolved_google_key and ocr_enabled:
+            # Skip rebuilding when key and OCR-relevant settings are unchanged
+            service_key = hash((
+                resolved_google_key,
+                user_settings.get("ocr_min_confidence"),
+                user_settings.get("ocr_min_char_count"),
+                user_settings.get("preferred_language"),
+                user_settings.get("language", {}).get("preferred"),
+                user_settings.get("api_keys", {}).get("mode"),
+            ))
+            if _ocr_service is not None and service_key == _ocr_service_key:
+                logger.debug("OCR service unchanged - reusing existing instance")
+                return
+            
             # Create or update OCR service
             _ocr_service = OCRService(
                 api_key=resolved_google_key,
                 user_settings=user_settings
             )
+            _ocr_service_key = service_key
             key_source = api_key_resolver.get_key_source(user_settings)
-            logger.info(f"OCR service updated with key from: {key_source} (strict mode)")
+            logger.info("OCR service updated with key from: %s (strict mode)", key_source)
         else:
             # Disable OCR service
             _ocr_service = None
+            _ocr_service_key = None
             if not resolved_google_key:
                 logger.info("OCR service disabled - no Google API key available")
             else:
                 logger.info("OCR service disabled - OCR setting disabled in user settings")
             
     except Exception as e:
-        logger.error(f"Failed to update OCR service with user settings: {e}")
+        logger.error("Failed to update OCR service with user settings: %s", e)
         _ocr_service = None
+        _ocr_service_key = None
 
 
 # Domain service dependencies
-def get_document_service(
+async def get_document_service(
     rag_engine: RAGEngine = Depends(get_rag_engine),
     document_registry: DocumentRegistry = Depends(get_document_registry),
     ocr_service: Optional[OCRService] = Depends(get_ocr_service),
@@ -303,34 +358,81 @@ def get_document_service(
         rag_engine=rag_engine,
         document_registry=document_registry,
         max_file_size_mb=settings.storage.max_file_size_mb,
-        ocr_service=ocr_service
+        ocr_service=ocr_service,
+        on_corpus_changed=clear_chat_response_cache
     )
 
 
-def get_analytics_service(
-    rag_engine: RAGEngine = Depends(get_rag_engine),
-    analytics_storage: AnalyticsStorage = Depends(get_analytics_storage)
+async def get_analytics_service(
+    settings: Settings = Depends(get_config),
+    extraction_cache: ExtractionCache = Depends(get_extraction_cache)
 ) -> AnalyticsService:
-    """Get analytics service instance"""
-    return AnalyticsService(
-        rag_engine=rag_engine,
-        storage=analytics_storage
-    )
+    """
+    Get analytics service with LLM and resolved API key
+    Uses key resolution to support both system and user-provided keys
+    """
+    try:
+        # Load user settings
+        user_settings_storage = UserSettingsStorage()
+        user_settings = await user_settings_storage.load_settings()
+        user_settings_dict = user_settings.model_dump()
+        
+        # Resolve OpenAI API key
+        api_key_resolver = get_api_key_resolver()
+        resolved_key = api_key_resolver.resolve_openai_key(
+            user_settings=user_settings_dict,
+            fallback_key=settings.openai.api_key
+        )
+        
+        if not resolved_key:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="OpenAI API key not configured"
+            )
+        
+        key_source = api_key_resolver.get_key_source(user_settings_dict)
+        logger.debug(f"Analytics service using OpenAI key from: {key_source}")
+        
+        # Create OpenAI client with resolved key
+        client = OpenAIClient(resolved_key)
+        
+        async def llm_func(prompt: str, system_prompt: str) -> str:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ]
+            return await client.create_completion(messages, temperature=0.3)
+        
+        return AnalyticsService(
+            llm_func,
+            extraction_cache=extraction_cache,
+            model_id=client.default_model
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to create analytics service: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to initialize analytics service: {str(e)}"
+        )
 
 
-def get_agent_registry() -> 'AgentRegistry':
+async def get_agent_registry() -> AgentRegistry:
     """Get agent registry instance (singleton)"""
     global _agent_registry
     if _agent_registry is None:
-        from domain.agents.orchestrator import AgentRegistry
-        _agent_registry = AgentRegistry()
-        # Register available agent types
-        from domain.agents.market_research import MarketResearchAgent
-        _agent_registry.register_agent_type("market_research", MarketResearchAgent)
+        async with _init_lock:
+            if _agent_registry is None:
+                agent_registry = AgentRegistry()
+                # Register available agent types
+                agent_registry.register_agent_type("market_research", MarketResearchAgent)
+                _agent_registry = agent_registry
     return _agent_registry
 
 
-def get_agent_data_access_service(
+async def get_agent_data_access_service(
     rag_engine: RAGEngine = Depends(get_rag_engine),
     document_service: DocumentService = Depends(get_document_service),
     analytics_service: AnalyticsService = Depends(get_analytics_service)
@@ -338,26 +440,30 @@ def get_agent_data_access_service(
     """Get agent data access service instance (singleton)"""
     global _agent_data_access
     if _agent_data_access is None:
-        _agent_data_access = AgentDataAccessService(
-            rag_engine=rag_engine,
-            document_service=document_service,
-            analytics_service=analytics_service
-        )
+        async with _init_lock:
+            if _agent_data_access is None:
+                _agent_data_access = AgentDataAccessService(
+                    rag_engine=rag_engine,
+                    document_service=document_service,
+                    analytics_service=analytics_service
+                )
     return _agent_data_access
 
 
-def get_external_data_service() -> ExternalDataService:
+async def get_external_data_service() -> ExternalDataService:
     """Get external data service instance (singleton)"""
     global _external_data_service
     if _external_data_service is None:
-        _external_data_service = ExternalDataService()
+        async with _init_lock:
+            if _external_data_service is None:
+                _external_data_service = ExternalDataService()
     return _external_data_service
 
 
 
 
-def get_agent_orchestrator(
-    registry: 'AgentRegistry' = Depends(get_agent_registry),
+async def get_agent_orchestrator(
+    registry: AgentRegistry = Depends(get_agent_registry),
     data_access_service: AgentDataAccessService = Depends(get_agent_data_access_service),
     external_data_service: ExternalDataService = Depends(get_external_data_service)
 ) -> AgentOrchestrator:
@@ -369,35 +475,64 @@ def get_agent_orchestrator(
     )
 
 
-def get_chat_service(
-    chat_storage: ChatStorage = Depends(get_chat_storage)
+async def get_chat_response_cache() -> ResponseCache:
+    """Get chat RAG response cache instance (singleton)"""
+    global _chat_response_cache
+    if _chat_response_cache is None:
+        async with _init_lock:
+            if _chat_response_cache is None:
+                _chat_response_cache = ResponseCache()
+    return _chat_response_cache
+
+
+def clear_chat_response_cache() -> None:
+    """Drop cached chat RAG responses (documents, engine or settings changed)"""
+    if _chat_response_cache is not None:
+        _chat_response_cache.clear()
+
+
+async def get_chat_service(
+    chat_storage: ChatStorage = Depends(get_chat_storage),
+    response_cache: ResponseCache = Depends(get_chat_response_cache),
+    settings: Settings = Depends(get_config)
 ) -> ChatService:
     """Get chat service instance"""
-    # Try to get optional dependencies, but don't fail if they're not available
-    rag_engine = None
+    # Optional dependencies are only built when the RAG engine is available
+    rag_engine = _rag_engine_instance
     agent_orchestrator = None
     document_service = None
     
-    try:
-        rag_engine = get_rag_engine()
-    except:
-        pass  # RAG engine not available
-    
-    try:
-        agent_orchestrator = get_agent_orchestrator()
-    except:
-        pass  # Agent orchestrator not available
-    
-    try:
-        document_service = get_document_service()
-    except:
-        pass  # Document service not available
+    if rag_engine is not None:
+        document_service = await get_document_service(
+            rag_engine=rag_engine,
+            document_registry=await get_document_registry(settings),
+            ocr_service=_ocr_service,
+            settings=settings
+        )
+        try:
+            analytics_service = await get_analytics_service(
+                settings=settings,
+                extraction_cache=await get_extraction_cache(settings)
+            )
+            agent_orchestrator = await get_agent_orchestrator(
+                registry=await get_agent_registry(),
+                data_access_service=await get_agent_data_access_service(
+                    rag_engine=rag_engine,
+                    document_service=document_service,
+                    analytics_service=analytics_service
+                ),
+                external_data_service=await get_external_data_service()
+            )
+        except HTTPException as e:
+            # Chat still works without agents; agent requests report unavailability
+            logger.warning(f"Agent orchestrator not available for chat: {e.detail}")
     
     return ChatService(
         chat_storage=chat_storage,
         rag_engine=rag_engine,
         agent_orchestrator=agent_orchestrator,
-        document_service=document_service
+        document_service=document_service,
+        response_cache=response_cache
     )
 
 
@@ -444,15 +579,15 @@ def get_subscription_service() -> 'SubscriptionService':
     Raises:
         HTTPException: If subscription service not initialized
     """
-    global _subscription_service
+    subscription_service = _subscription_service
     
-    if _subscription_service is None:
+    if subscription_service is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Subscription service not initialized"
+            detail=_SUBSCRIPTION_UNAVAILABLE_DETAIL
         )
     
-    return _subscription_service
+    return subscription_service
 
 
 def subscription_service_available() -> bool:
@@ -462,11 +597,10 @@ def subscription_service_available() -> bool:
     Returns:
         bool: True if subscription service is initialized and available
     """
-    global _subscription_service
     return _subscription_service is not None
 
 
-def get_subscription_aware_document_service(
+async def get_subscription_aware_document_service(
     rag_engine: RAGEngine = Depends(get_rag_engine),
     document_registry: DocumentRegistry = Depends(get_document_registry),
     ocr_service: Optional[OCRService] = Depends(get_ocr_service),
@@ -476,19 +610,36 @@ def get_subscription_aware_document_service(
     """
     Get subscription-aware document service instance
     
-    This service enforces subscription limits before processing documents
+    This service enforces subscription limits before processing documents.
+    Reused across requests until the subscription or any injected service changes.
     """
+    global _subscription_document_service, _subscription_document_service_key
+    
+    cache_key = (
+        subscription_service.version,
+        settings.storage.max_file_size_mb,
+        rag_engine,
+        document_registry,
+        ocr_service
+    )
+    if _subscription_document_service is not None and cache_key == _subscription_document_service_key:
+        return _subscription_document_service
+    
     # Get current subscription limits
-    subscription = subscription_service.get_current_subscription()
+    subscription = await subscription_service.get_current_subscription_async()
     
     # Use subscription-based file size limit if available
     max_file_size_mb = settings.storage.max_file_size_mb
-    if subscription.get_features().max_doc_size_mb > 0:
-        max_file_size_mb = min(max_file_size_mb, subscription.get_features().max_doc_size_mb)
+    max_doc_size_mb = subscription.get_features().max_doc_size_mb
+    if max_doc_size_mb > 0:
+        max_file_size_mb = min(max_file_size_mb, max_doc_size_mb)
     
-    return DocumentService(
+    _subscription_document_service = DocumentService(
         rag_engine=rag_engine,
         document_registry=document_registry,
         max_file_size_mb=max_file_size_mb,
-        ocr_service=ocr_service
-    )
\ No newline at end of file
+        ocr_service=ocr_service,
+        on_corpus_changed=clear_chat_response_cache
+    )
+    _subscription_document_service_key = cache_key
+    return _subscription_document_service
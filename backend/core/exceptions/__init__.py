@@ -0,0 +1,64 @@
+"""
+Custom Exception Classes
+Hierarchical exception structure for better error handling
+
+Commonly raised exceptions are imported eagerly from base; domain-specific
+ones are loaded on first access (PEP 562) to keep cold-start imports small.
+"""
+import importlib
+from typing import Dict, Final
+
+from core.exceptions.base import (
+    CovenantrixException,
+    StorageException,
+    StorageError,
+    StorageReadError,
+    StorageWriteError,
+    ConfigurationError,
+    ServiceNotAvailableError,
+    ProcessingError,
+)
+
+# Exception name -> submodule that defines it
+_LAZY_EXCEPTIONS: Final[Dict[str, str]] = {
+    "DocumentException": "documents",
+    "DocumentNotFoundError": "documents",
+    "DocumentProcessingError": "documents",
+    "InvalidDocumentFormatError": "documents",
+    "AnalyticsException": "analytics",
+    "ClassificationError": "analytics",
+    "ExtractionError": "analytics",
+    "AgentException": "agents",
+    "AgentNotFoundError": "agents",
+    "AgentExecutionError": "agents",
+    "IntegrationException": "integrations",
+    "OAuthError": "integrations",
+    "ExternalAPIError": "integrations",
+    "ExternalServiceError": "integrations",
+}
+
+__all__ = [
+    "CovenantrixException",
+    "StorageException",
+    "StorageError",
+    "StorageReadError",
+    "StorageWriteError",
+    "ConfigurationError",
+    "ServiceNotAvailableError",
+    "ProcessingError",
+    *_LAZY_EXCEPTIONS,
+]
+
+
+def __getattr__(name: str):
+    """Load domain-specific exceptions from their submodule on first access"""
+    submodule = _LAZY_EXCEPTIONS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,40 @@
+"""
+Agent Exceptions
+"""
+from typing import Optional
+from fastapi import status
+
+from core.exceptions.base import CovenantrixException
+
+
+class AgentException(CovenantrixException):
+    """Base exception for agent-related errors"""
+    __slots__ = ()
+
+
+class AgentNotFoundError(AgentException):
+    """Agent not found in registry"""
+    
+    __slots__ = ()
+    
+    def __init__(self, agent_id: str):
+        super().__init__(
+            message=f"Agent not found: {agent_id}",
+            error_code="AGENT_NOT_FOUND",
+            status_code=status.HTTP_404_NOT_FOUND,
+            details={"agent_id": agent_id}
+        )
+
+
+class AgentExecutionError(AgentException):
+    """Error during agent task execution"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, agent_id: Optional[str] = None):
+        super().__init__(
+            message=message,
+            error_code="AGENT_EXECUTION_ERROR",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            details={"agent_id": agent_id} if agent_id else None
+        )
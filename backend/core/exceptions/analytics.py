@@ -0,0 +1,40 @@
+"""
+Analytics Exceptions
+"""
+from typing import Optional
+from fastapi import status
+
+from core.exceptions.base import CovenantrixException
+
+
+class AnalyticsException(CovenantrixException):
+    """Base exception for analytics-related errors"""
+    __slots__ = ()
+
+
+class ClassificationError(AnalyticsException):
+    """Error during document classification"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, document_id: Optional[str] = None):
+        super().__init__(
+            message=message,
+            error_code="CLASSIFICATION_ERROR",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            details={"document_id": document_id} if document_id else None
+        )
+
+
+class ExtractionError(AnalyticsException):
+    """Error during metadata extraction"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, document_id: Optional[str] = None):
+        super().__init__(
+            message=message,
+            error_code="EXTRACTION_ERROR",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            details={"document_id": document_id} if document_id else None
+        )
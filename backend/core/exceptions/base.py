@@ -0,0 +1,129 @@
+"""
+Base Exception Classes
+Base application exception and commonly raised storage/configuration errors
+"""
+from typing import Optional, Dict, Any
+from fastapi import status
+
+# Shared details for exceptions raised without any; treat as read-only.
+# A plain dict (not MappingProxyType) so JSONResponse can serialize it.
+_EMPTY_DETAILS: Dict[str, Any] = {}
+
+
+class CovenantrixException(Exception):
+    """Base exception for all application errors"""
+    
+    __slots__ = ("message", "error_code", "status_code", "details", "_dict")
+    
+    def __init__(
+        self,
+        message: str,
+        error_code: str,
+        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        self.message = message
+        self.error_code = error_code
+        self.status_code = status_code
+        self.details = details or _EMPTY_DETAILS
+        self._dict: Optional[Dict[str, Any]] = None
+        super().__init__(self.message)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert exception to dictionary for API responses
+        Built on first call (after subclass __init__ has set details) and cached
+        """
+        if self._dict is None:
+            self._dict = {
+                "error": self.error_code,
+                "message": self.message,
+                "details": self.details
+            }
+        return self._dict
+
+
+class StorageException(CovenantrixException):
+    """Base exception for storage-related errors"""
+    __slots__ = ()
+
+
+class StorageError(StorageException):
+    """General storage error"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            error_code="STORAGE_ERROR",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            details=details
+        )
+
+
+class StorageReadError(StorageException):
+    """Error reading from storage"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            error_code="STORAGE_READ_ERROR",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+class StorageWriteError(StorageException):
+    """Error writing to storage"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            error_code="STORAGE_WRITE_ERROR",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+class ConfigurationError(CovenantrixException):
+    """Configuration error"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            error_code="CONFIGURATION_ERROR",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+class ServiceNotAvailableError(CovenantrixException):
+    """Service not available error"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, service: str):
+        super().__init__(
+            message=message,
+            error_code="SERVICE_NOT_AVAILABLE",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            details={"service": service}
+        )
+
+
+class ProcessingError(CovenantrixException):
+    """Processing error"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            error_code="PROCESSING_ERROR",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            details=details
+        )
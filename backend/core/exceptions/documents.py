@@ -0,0 +1,57 @@
+"""
+Document Exceptions
+"""
+from typing import Optional
+from fastapi import status
+
+from core.exceptions.base import CovenantrixException
+
+
+class DocumentException(CovenantrixException):
+    """Base exception for document-related errors"""
+    __slots__ = ()
+
+
+class DocumentNotFoundError(DocumentException):
+    """Document not found in storage"""
+    
+    __slots__ = ()
+    
+    def __init__(self, document_id: str):
+        super().__init__(
+            message=f"Document not found: {document_id}",
+            error_code="DOCUMENT_NOT_FOUND",
+            status_code=status.HTTP_404_NOT_FOUND,
+            details={"document_id": document_id}
+        )
+
+
+class DocumentProcessingError(DocumentException):
+    """Error during document processing"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, document_id: Optional[str] = None):
+        super().__init__(
+            message=message,
+            error_code="DOCUMENT_PROCESSING_ERROR",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            details={"document_id": document_id} if document_id else None
+        )
+
+
+class InvalidDocumentFormatError(DocumentException):
+    """Invalid or unsupported document format"""
+    
+    __slots__ = ()
+    
+    def __init__(self, filename: str, supported_formats: list):
+        super().__init__(
+            message=f"Unsupported document format: {filename}",
+            error_code="INVALID_DOCUMENT_FORMAT",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            details={
+                "filename": filename,
+                "supported_formats": supported_formats
+            }
+        )
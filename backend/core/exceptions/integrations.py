@@ -0,0 +1,45 @@
+"""
+External Integration Exceptions
+"""
+from fastapi import status
+
+from core.exceptions.base import CovenantrixException
+
+
+class IntegrationException(CovenantrixException):
+    """Base exception for external integration errors"""
+    __slots__ = ()
+
+
+class OAuthError(IntegrationException):
+    """OAuth authentication error"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, provider: str = "google"):
+        super().__init__(
+            message=message,
+            error_code="OAUTH_ERROR",
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            details={"provider": provider}
+        )
+
+
+class ExternalAPIError(IntegrationException):
+    """External API call failed"""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, service: str):
+        super().__init__(
+            message=message,
+            error_code="EXTERNAL_API_ERROR",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            details={"service": service}
+        )
+
+
+# Alias for compatibility
+class ExternalServiceError(ExternalAPIError):
+    """Alias for ExternalAPIError"""
+    __slots__ = ()
@@ -10,27 +10,17 @@ from pathlib import Path
 from core.config import get_settings
 
 
-class ContextFilter(logging.Filter):
-    """Add context information to log records"""
-    
-    def filter(self, record):
-        # Add default values if not present
-        if not hasattr(record, 'request_id'):
-            record.request_id = 'N/A'
-        if not hasattr(record, 'user_id'):
-            record.user_id = 'N/A'
-        
-        # Handle Unicode in log messages (e.g., Hebrew filenames)
-        # Ensure message formatting doesn't fail on non-ASCII characters
-        try:
-            if hasattr(record, 'msg') and isinstance(record.msg, str):
-                # Try to encode/decode to catch potential issues early
-                record.msg.encode('utf-8')
-        except Exception:
-            # If there's any encoding issue, replace with safe representation
-            record.msg = repr(record.msg)
-        
-        return True
+# Shared formatter for all handlers
+# Context fields fall back to defaults when a record has no extra values
+_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+    validate=False,  # Static format string; skip the validation regex pass
+    defaults={'request_id': 'N/A', 'user_id': 'N/A'}
+)
+
+# Set once setup_logging has installed the root handlers
+_configured = False
 
 
 def setup_logging(
@@ -44,17 +34,16 @@ def setup_logging(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional log file path
     """
+    global _configured
+    if _configured:
+        # Repeat calls would open handlers that basicConfig then ignores
+        return
+    
     settings = get_settings()
     
     # Determine log level
     level = log_level or ("DEBUG" if settings.server.debug else "INFO")
     
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
     # Console handler with UTF-8 encoding for Hebrew/Unicode filenames
     console_handler = logging.StreamHandler(sys.stdout)
     
@@ -66,15 +55,13 @@ def setup_logging(
         except Exception:
             pass  # Fallback if reconfigure fails
     
-    console_handler.setFormatter(formatter)
-    console_handler.addFilter(ContextFilter())
+    console_handler.setFormatter(_FORMATTER)
     
     # File handler (optional) with UTF-8 encoding
     handlers = [console_handler]
     if log_file:
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setFormatter(formatter)
-        file_handler.addFilter(ContextFilter())
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', errors='replace')
+        file_handler.setFormatter(_FORMATTER)
         handlers.append(file_handler)
     
     # Configure root logger
@@ -82,6 +69,7 @@ def setup_logging(
         level=getattr(logging, level),
         handlers=handlers
     )
+    _configured = True
     
     # Set levels for specific loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -5,7 +5,8 @@ Encryption, hashing, and secure storage utilities
 import hashlib
 import os
 import platform
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Tuple
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -13,6 +14,33 @@ import base64
 import json
 
 
+# Machine-derived keys and ciphers are deterministic for the process lifetime,
+# so they are shared across APIKeyManager instances
+_MACHINE_KEY_CACHE: Dict[Tuple[str, str], bytes] = {}
+_CIPHER_CACHE: Dict[bytes, Fernet] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Field names masked by sanitize_for_logging (compared lowercased)
+_SENSITIVE_KEYS = frozenset({"openai", "cohere", "google", "api_key", "key", "token"})
+
+# Host platform details never change at runtime, so resolve them once
+_SYSTEM = platform.system()
+_SYSTEM_INFO = f"{_SYSTEM}-{platform.machine()}"
+_NODENAME: Optional[str] = os.uname().nodename if hasattr(os, "uname") else None
+
+# Fernet tokens always start with this prefix (version byte 0x80). Values written
+# by older releases carry an extra urlsafe-base64 layer and never match it.
+_FERNET_TOKEN_PREFIX = b"gAAAAA"
+
+# Provider -> (required prefix, length the key must exceed)
+_API_KEY_RULES: Dict[str, Tuple[str, int]] = {
+    "openai": ("sk-", 20),
+    "cohere": ("", 20),
+    "google": ("", 20),
+}
+_DEFAULT_API_KEY_RULE: Tuple[str, int] = ("", 10)
+
+
 class APIKeyManager:
     """Secure API key management with machine-derived encryption"""
     
@@ -25,7 +53,11 @@ class APIKeyManager:
         """
         if encryption_key is None:
             encryption_key = self._generate_machine_key()
-        self.cipher = Fernet(encryption_key)
+        with _CACHE_LOCK:
+            cipher = _CIPHER_CACHE.get(encryption_key)
+            if cipher is None:
+                cipher = _CIPHER_CACHE[encryption_key] = Fernet(encryption_key)
+        self.cipher = cipher
         self._encryption_key = encryption_key
     
     def _generate_machine_key(self) -> bytes:
@@ -36,19 +68,24 @@ class APIKeyManager:
         try:
             # Get machine-specific identifiers
             machine_id = self._get_machine_id()
-            system_info = f"{platform.system()}-{platform.machine()}"
-            
-            # Create deterministic salt
-            salt = hashlib.sha256(f"{machine_id}-{system_info}".encode()).digest()
+            system_info = _SYSTEM_INFO
+            cache_key = (machine_id, system_info)
             
-            # Derive key using PBKDF2
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(machine_id.encode()))
+            with _CACHE_LOCK:
+                key = _MACHINE_KEY_CACHE.get(cache_key)
+                if key is None:
+                    # Create deterministic salt
+                    salt = hashlib.sha256(f"{machine_id}-{system_info}".encode()).digest()
+                    
+                    # Derive key using PBKDF2
+                    kdf = PBKDF2HMAC(
+                        algorithm=hashes.SHA256(),
+                        length=32,
+                        salt=salt,
+                        iterations=100000,
+                    )
+                    key = base64.urlsafe_b64encode(kdf.derive(machine_id.encode()))
+                    _MACHINE_KEY_CACHE[cache_key] = key
             return key
             
         except Exception as e:
@@ -59,30 +96,38 @@ class APIKeyManager:
         """Get machine-specific identifier"""
         try:
             # Try to get machine ID from various sources
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 # Windows: Use computer name and user profile
                 computer_name = os.environ.get("COMPUTERNAME", "unknown")
                 user_profile = os.environ.get("USERPROFILE", "unknown")
                 return f"{computer_name}-{user_profile}"
-            elif platform.system() == "Darwin":
+            elif _SYSTEM == "Darwin":
                 # macOS: Use hostname and user
-                hostname = os.uname().nodename
+                hostname = _NODENAME
                 user = os.environ.get("USER", "unknown")
                 return f"{hostname}-{user}"
             else:
                 # Linux: Use hostname and user
-                hostname = os.uname().nodename
+                hostname = _NODENAME
                 user = os.environ.get("USER", "unknown")
                 return f"{hostname}-{user}"
         except Exception:
             # Fallback to a generic identifier
             return "covenantrix-default"
     
+    @staticmethod
+    def _to_fernet_token(value: str) -> bytes:
+        """Return the raw Fernet token, unwrapping the legacy base64 layer if present"""
+        token = value.encode()
+        if token.startswith(_FERNET_TOKEN_PREFIX):
+            return token
+        return base64.urlsafe_b64decode(token)
+    
     def encrypt_key(self, api_key: str) -> str:
         """Encrypt API key"""
         try:
-            encrypted = self.cipher.encrypt(api_key.encode())
-            return base64.urlsafe_b64encode(encrypted).decode()
+            # Fernet tokens are already urlsafe-base64 ASCII
+            return self.cipher.encrypt(api_key.encode()).decode("ascii")
         except Exception as e:
             raise ValueError(f"Failed to encrypt API key: {str(e)}")
     
@@ -92,31 +137,27 @@ class APIKeyManager:
             if not encrypted_key:
                 raise ValueError("Empty encrypted key provided")
             
-            decoded = base64.urlsafe_b64decode(encrypted_key.encode())
-            decrypted = self.cipher.decrypt(decoded)
+            decrypted = self.cipher.decrypt(self._to_fernet_token(encrypted_key))
             return decrypted.decode()
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            raise ValueError(f"Failed to decrypt API key: {str(e)} | Details: {error_details}")
+            raise ValueError(f"Failed to decrypt API key: {str(e)}") from e
     
     def encrypt_settings(self, settings: Dict[str, Any]) -> str:
         """Encrypt settings dictionary"""
         try:
-            settings_json = json.dumps(settings)
-            encrypted = self.cipher.encrypt(settings_json.encode())
-            return base64.urlsafe_b64encode(encrypted).decode()
+            settings_json = json.dumps(settings, separators=(",", ":"))
+            return self.cipher.encrypt(settings_json.encode()).decode("ascii")
         except Exception as e:
             raise ValueError(f"Failed to encrypt settings: {str(e)}")
     
     def decrypt_settings(self, encrypted_settings: str) -> Dict[str, Any]:
         """Decrypt settings dictionary"""
         try:
-            decoded = base64.urlsafe_b64decode(encrypted_settings.encode())
-            decrypted = self.cipher.decrypt(decoded)
-            return json.loads(decrypted.decode())
+            decrypted = self.cipher.decrypt(self._to_fernet_token(encrypted_settings))
+            # json.loads accepts UTF-8 bytes directly
+            return json.loads(decrypted)
         except Exception as e:
-            raise ValueError(f"Failed to decrypt settings: {str(e)}")
+            raise ValueError(f"Failed to decrypt settings: {str(e)}") from e
     
     def encrypt_oauth_credentials(self, credentials: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -164,33 +205,54 @@ class APIKeyManager:
     
     def validate_api_key_format(self, api_key: str, key_type: str) -> bool:
         """Validate API key format"""
-        if not api_key or not isinstance(api_key, str):
+        if not isinstance(api_key, str) or not api_key:
             return False
         
-        if key_type == "openai":
-            return api_key.startswith("sk-") and len(api_key) > 20
-        elif key_type == "cohere":
-            return len(api_key) > 20
-        elif key_type == "google":
-            return len(api_key) > 20
-        else:
-            return len(api_key) > 10
+        prefix, min_length = _API_KEY_RULES.get(key_type, _DEFAULT_API_KEY_RULE)
+        return len(api_key) > min_length and api_key.startswith(prefix)
     
     def sanitize_for_logging(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Sanitize data for logging by masking sensitive fields"""
-        sanitized = data.copy()
-        sensitive_keys = ["openai", "cohere", "google", "api_key", "key", "token"]
+        """
+        Sanitize data for logging by masking sensitive fields
+        Returns data itself (uncopied) when nothing needs masking
+        """
+        sanitized = None
         
-        for key, value in sanitized.items():
+        for key, value in data.items():
             if isinstance(value, dict):
-                sanitized[key] = self.sanitize_for_logging(value)
-            elif key.lower() in sensitive_keys and isinstance(value, str):
-                if len(value) > 8:
-                    sanitized[key] = f"{value[:4]}...{value[-4:]}"
-                else:
-                    sanitized[key] = "***"
+                masked = self.sanitize_for_logging(value)
+                if masked is value:
+                    continue
+            elif isinstance(value, str) and key.lower() in _SENSITIVE_KEYS:
+                masked = f"{value[:4]}...{value[-4:]}" if len(value) > 8 else "***"
+            else:
+                continue
+            
+            if sanitized is None:
+                sanitized = data.copy()
+            sanitized[key] = masked
         
-        return sanitized
+        return data if sanitized is None else sanitized
+
+
+# Global API key manager instance
+_api_key_manager: Optional[APIKeyManager] = None
+_api_key_manager_lock = threading.Lock()
+
+
+def get_api_key_manager() -> APIKeyManager:
+    """
+    Get or create the machine-keyed API key manager (singleton)
+    
+    Returns:
+        API key manager instance
+    """
+    global _api_key_manager
+    if _api_key_manager is None:
+        with _api_key_manager_lock:
+            if _api_key_manager is None:
+                _api_key_manager = APIKeyManager()
+    return _api_key_manager
 
 
 def hash_string(value: str) -> str:
@@ -200,8 +262,10 @@ def hash_string(value: str) -> str:
 
 def generate_document_id(content: str, filename: str) -> str:
     """Generate deterministic document ID from content and filename"""
-    combined = f"{filename}:{content[:1000]}"  # First 1000 chars
-    return hashlib.sha256(combined.encode()).hexdigest()[:16]
+    digest = hashlib.sha256(filename.encode())
+    digest.update(b":")
+    digest.update(content[:1000].encode())  # First 1000 chars
+    return digest.digest()[:8].hex()
 
 
 def validate_file_extension(filename: str, allowed_extensions: list) -> bool:
@@ -2,8 +2,10 @@
 Market Research Agent
 Analyzes rental properties and provides market recommendations
 """
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from typing import ClassVar, Dict, Any, List, Optional, Tuple
 
 from domain.agents.base import BaseAgent, IAgentDataAccess, IExternalDataService
 from domain.agents.models import (
@@ -13,6 +15,12 @@ from domain.agents.exceptions import AgentExecutionError
 
 logger = logging.getLogger(__name__)
 
+_NUMBER_RE = re.compile(r'\d+')
+
+# Rent multiplier per bedroom count; 4+ bedrooms use _LARGE_BEDROOM_FACTOR
+_BEDROOM_FACTOR: Dict[int, float] = {1: 0.8, 2: 1.0, 3: 1.2}
+_LARGE_BEDROOM_FACTOR = 1.4
+
 
 class MarketResearchAgent(BaseAgent):
     """
@@ -23,6 +31,40 @@ class MarketResearchAgent(BaseAgent):
     
     TASK_TYPE_RENT_ANALYSIS = "rent_analysis"
     
+    # Capabilities are constant, so every instance shares one list
+    _CAPABILITIES: ClassVar[List[AgentCapability]] = [
+        AgentCapability(
+            name="rent_analysis",
+            description="Analyze property and provide rent recommendations",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "document_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Document IDs to analyze (lease agreements)"
+                    },
+                    "property_address": {
+                        "type": "string",
+                        "description": "Property address (optional)"
+                    }
+                },
+                "required": ["document_ids"]
+            },
+            output_schema={
+                "type": "object",
+                "properties": {
+                    "current_rent": {"type": "number"},
+                    "recommended_rent": {"type": "number"},
+                    "market_average": {"type": "number"},
+                    "confidence": {"type": "number"},
+                    "reasoning": {"type": "string"},
+                    "market_factors": {"type": "object"}
+                }
+            }
+        )
+    ]
+    
     def __init__(
         self,
         agent_id: str,
@@ -38,39 +80,8 @@ class MarketResearchAgent(BaseAgent):
         )
     
     def get_capabilities(self) -> List[AgentCapability]:
-        """Get agent capabilities"""
-        return [
-            AgentCapability(
-                name="rent_analysis",
-                description="Analyze property and provide rent recommendations",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "document_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Document IDs to analyze (lease agreements)"
-                        },
-                        "property_address": {
-                            "type": "string",
-                            "description": "Property address (optional)"
-                        }
-                    },
-                    "required": ["document_ids"]
-                },
-                output_schema={
-                    "type": "object",
-                    "properties": {
-                        "current_rent": {"type": "number"},
-                        "recommended_rent": {"type": "number"},
-                        "market_average": {"type": "number"},
-                        "confidence": {"type": "number"},
-                        "reasoning": {"type": "string"},
-                        "market_factors": {"type": "object"}
-                    }
-                }
-            )
-        ]
+        """Get agent capabilities (shared, built once at import)"""
+        return self._CAPABILITIES
     
     async def execute_task(self, task: Task) -> Dict[str, Any]:
         """
@@ -118,13 +129,14 @@ class MarketResearchAgent(BaseAgent):
         document_ids = task.parameters["document_ids"]
         
         try:
-            # Step 1: Extract property information from documents (20%)
+            # Step 1: Scan document analytics for address and current rent (20%)
             task.update_progress(0.1)
-            property_info = await self._extract_property_info(document_ids)
+            analytics_list = await self._fetch_document_analytics(document_ids)
+            address, current_rent = self._scan_analytics(analytics_list)
             
-            # Step 2: Get current rent from documents (40%)
+            # Step 2: Extract property information from documents (40%)
             task.update_progress(0.3)
-            current_rent = await self._extract_current_rent(document_ids)
+            property_info = await self._extract_property_info(document_ids, address)
             
             # Step 3: Fetch market data (60%)
             task.update_progress(0.5)
@@ -172,13 +184,57 @@ class MarketResearchAgent(BaseAgent):
                 agent_id=self.agent.id
             )
     
-    async def _extract_property_info(
+    async def _fetch_document_analytics(
         self,
         document_ids: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Fetch analytics for all documents concurrently (None where unavailable)"""
+        return await asyncio.gather(
+            *(self.data_access.get_document_analytics(doc_id) for doc_id in document_ids)
+        )
+    
+    def _scan_analytics(
+        self,
+        analytics_list: List[Optional[Dict[str, Any]]]
+    ) -> Tuple[Optional[str], Optional[float]]:
+        """Find the property address and current rent in one pass over analytics"""
+        address = None
+        current_rent = None
+        
+        for analytics in analytics_list:
+            if not analytics:
+                continue
+            
+            metadata = analytics.get("metadata") or {}
+            
+            # Look for address (first named address entity wins)
+            if address is None:
+                for entity in metadata.get("entities", ()):
+                    if entity.get("type") == "address" and entity.get("name"):
+                        address = entity["name"]
+                        break
+            
+            # Look for monthly rent in monetary values
+            if current_rent is None:
+                for value in metadata.get("monetary_values", ()):
+                    context = value.get("context", "").lower()
+                    if "rent" in context or "monthly" in context:
+                        current_rent = float(value.get("amount", 0))
+                        break
+            
+            if address is not None and current_rent is not None:
+                break
+        
+        return address, current_rent
+    
+    async def _extract_property_info(
+        self,
+        document_ids: List[str],
+        address: Optional[str]
     ) -> Dict[str, Any]:
         """Extract property information from documents"""
         property_info = {
-            "address": None,
+            "address": address,
             "size_sqm": None,
             "bedrooms": None,
             "bathrooms": None,
@@ -187,21 +243,6 @@ class MarketResearchAgent(BaseAgent):
             "amenities": []
         }
         
-        # Get analytics for each document
-        for doc_id in document_ids:
-            analytics = await self.data_access.get_document_analytics(doc_id)
-            if not analytics:
-                continue
-            
-            # Extract from entities
-            if "metadata" in analytics:
-                metadata = analytics["metadata"]
-                
-                # Look for address
-                for entity in metadata.get("entities", []):
-                    if entity.get("type") == "address" and not property_info["address"]:
-                        property_info["address"] = entity.get("name")
-        
         # Query for additional property details
         if document_ids:
             query_result = await self.data_access.query_documents(
@@ -213,36 +254,16 @@ class MarketResearchAgent(BaseAgent):
             # (simplified - real implementation would use LLM to extract structured data)
             response = query_result.get("response", "")
             
-            # Extract numbers from response (very basic)
-            import re
-            numbers = re.findall(r'\d+', response)
-            if len(numbers) >= 2:
-                property_info["size_sqm"] = int(numbers[0])
-                property_info["bedrooms"] = int(numbers[1])
+            # Extract the first two numbers from response (very basic)
+            matches = _NUMBER_RE.finditer(response)
+            first = next(matches, None)
+            second = next(matches, None)
+            if second is not None:
+                property_info["size_sqm"] = int(first.group())
+                property_info["bedrooms"] = int(second.group())
         
         return property_info
     
-    async def _extract_current_rent(
-        self,
-        document_ids: List[str]
-    ) -> Optional[float]:
-        """Extract current rent from documents"""
-        # Look for rent in analytics
-        for doc_id in document_ids:
-            analytics = await self.data_access.get_document_analytics(doc_id)
-            if not analytics:
-                continue
-            
-            metadata = analytics.get("metadata", {})
-            
-            # Look for monthly rent in monetary values
-            for value in metadata.get("monetary_values", []):
-                context = value.get("context", "").lower()
-                if "rent" in context or "monthly" in context:
-                    return float(value.get("amount", 0))
-        
-        return None
-    
     async def _fetch_market_data(
         self,
         property_info: Dict[str, Any]
@@ -284,28 +305,22 @@ class MarketResearchAgent(BaseAgent):
         """Calculate rent recommendation with enhanced algorithm"""
         market_avg = market_data.get("average_rent", 2500.0)
         
-        # Start with market average
-        recommended_rent = market_avg
-        
         # Adjust for property size (size_sqm > 100: +10%, < 60: -10%)
         size_sqm = property_info.get("size_sqm")
-        if size_sqm:
-            if size_sqm > 100:
-                recommended_rent *= 1.1
-            elif size_sqm < 60:
-                recommended_rent *= 0.9
+        size_factor = (
+            1.1 if size_sqm and size_sqm > 100
+            else 0.9 if size_sqm and size_sqm < 60
+            else 1.0
+        )
         
         # Adjust for bedroom count
         bedrooms = property_info.get("bedrooms")
-        if bedrooms:
-            if bedrooms == 1:
-                recommended_rent *= 0.8
-            elif bedrooms == 2:
-                recommended_rent *= 1.0
-            elif bedrooms == 3:
-                recommended_rent *= 1.2
-            elif bedrooms >= 4:
-                recommended_rent *= 1.4
+        bedroom_factor = _BEDROOM_FACTOR.get(
+            bedrooms,
+            _LARGE_BEDROOM_FACTOR if bedrooms and bedrooms >= 4 else 1.0
+        )
+        
+        recommended_rent = market_avg * size_factor * bedroom_factor
         
         # Use external data confidence if available, otherwise calculate
         if "confidence" in market_data:
@@ -335,50 +350,47 @@ class MarketResearchAgent(BaseAgent):
         recommendation: Dict[str, Any]
     ) -> str:
         """Generate human-readable reasoning"""
-        lines = []
-        
-        lines.append("Market Analysis Summary:")
-        lines.append("")
-        
-        # Current rent
-        if current_rent:
-            lines.append(f"Current Rent: ${current_rent:,.2f}/month")
-        else:
-            lines.append("Current Rent: Not available in documents")
-        
-        # Recommendation
-        lines.append(f"Recommended Rent: ${recommendation['recommended_rent']:,.2f}/month")
-        lines.append(f"Market Average: ${recommendation['market_average']:,.2f}/month")
-        
-        # Confidence
-        confidence_pct = recommendation['confidence'] * 100
-        lines.append(f"Confidence: {confidence_pct:.0f}%")
-        lines.append("")
+        size_sqm = property_info.get("size_sqm")
+        bedrooms = property_info.get("bedrooms")
+        sample_size = market_data.get("sample_size")
         
-        # Factors
-        lines.append("Analysis Factors:")
-        if property_info.get("size_sqm"):
-            lines.append(f"- Property size: {property_info['size_sqm']} sqm")
-        if property_info.get("bedrooms"):
-            lines.append(f"- Bedrooms: {property_info['bedrooms']}")
-        if market_data.get("sample_size"):
-            lines.append(f"- Market sample size: {market_data['sample_size']} properties")
+        lines = [
+            "Market Analysis Summary:",
+            "",
+            # Current rent
+            f"Current Rent: ${current_rent:,.2f}/month" if current_rent
+            else "Current Rent: Not available in documents",
+            # Recommendation
+            f"Recommended Rent: ${recommendation['recommended_rent']:,.2f}/month",
+            f"Market Average: ${recommendation['market_average']:,.2f}/month",
+            # Confidence
+            f"Confidence: {recommendation['confidence'] * 100:.0f}%",
+            "",
+            # Factors
+            "Analysis Factors:"
+        ]
+        if size_sqm:
+            lines.append(f"- Property size: {size_sqm} sqm")
+        if bedrooms:
+            lines.append(f"- Bedrooms: {bedrooms}")
+        if sample_size:
+            lines.append(f"- Market sample size: {sample_size} properties")
         
         # Data source information
-        source = market_data.get("source", "unknown")
-        lines.append(f"- Data source: {source}")
+        lines.append(f"- Data source: {market_data.get('source', 'unknown')}")
         
-        if "source_chain" in market_data:
-            source_chain = market_data["source_chain"]
-            if len(source_chain) > 1:
-                lines.append(f"- Data sources tried: {', '.join(source_chain)}")
+        source_chain = market_data.get("source_chain")
+        if source_chain is not None and len(source_chain) > 1:
+            lines.append(f"- Data sources tried: {', '.join(source_chain)}")
         
         # Market factors if available
-        market_factors = market_data.get("market_factors", {})
+        market_factors = market_data.get("market_factors")
         if market_factors:
             lines.append("- Market factors:")
-            for key, value in market_factors.items():
-                if value is not None:
-                    lines.append(f"  * {key}: {value}")
+            lines.extend(
+                f"  * {key}: {value}"
+                for key, value in market_factors.items()
+                if value is not None
+            )
         
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
@@ -35,16 +35,27 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Plain string values for serialization, resolved once per enum member
+_AGENT_TYPE_VALUES: Dict[AgentType, str] = {t: t.value for t in AgentType}
+_AGENT_STATUS_VALUES: Dict[AgentStatus, str] = {s: s.value for s in AgentStatus}
+_TASK_STATUS_VALUES: Dict[TaskStatus, str] = {s: s.value for s in TaskStatus}
+
+
+@dataclass(slots=True)
 class AgentCapability:
     """Agent capability description"""
     name: str
     description: str
     input_schema: Dict[str, Any]
     output_schema: Dict[str, Any]
+    # Serialized form used by Agent.to_dict, built once per capability
+    summary: Dict[str, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.summary = {"name": self.name, "description": self.description}
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """
     Agent entity
@@ -71,7 +82,7 @@ class Agent:
     ) -> "Agent":
         """Create a new agent instance"""
         return cls(
-            id=agent_id or str(uuid.uuid4()),
+            id=agent_id or uuid.uuid4().hex,
             type=agent_type,
             name=name,
             description=description,
@@ -80,25 +91,24 @@ class Agent:
         )
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+        """
+        Convert to dictionary
+        
+        Output only holds JSON-ready primitives, so API responses wrap it
+        with model_construct instead of re-validating.
+        """
         return {
             "id": self.id,
-            "type": self.type.value,
+            "type": _AGENT_TYPE_VALUES[self.type],
             "name": self.name,
             "description": self.description,
-            "status": self.status.value,
-            "capabilities": [
-                {
-                    "name": cap.name,
-                    "description": cap.description
-                }
-                for cap in self.capabilities
-            ],
+            "status": _AGENT_STATUS_VALUES[self.status],
+            "capabilities": [dict(cap.summary) for cap in self.capabilities],
             "created_at": self.created_at.isoformat()
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskRequest:
     """Request to execute agent task"""
     agent_id: str
@@ -119,7 +129,7 @@ class TaskRequest:
             raise ValueError("priority must be between 1 and 10")
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Agent task
@@ -147,7 +157,7 @@ class Task:
     ) -> "Task":
         """Create a new task instance"""
         return cls(
-            id=task_id or str(uuid.uuid4()),
+            id=task_id or uuid.uuid4().hex,
             agent_id=agent_id,
             task_type=task_type,
             parameters=parameters,
@@ -178,12 +188,17 @@ class Task:
         self.progress = max(0.0, min(1.0, progress))
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+        """
+        Convert to dictionary
+        
+        Output only holds JSON-ready primitives (result aside, which agents
+        build as plain dicts), so API responses wrap it with model_construct.
+        """
         return {
             "id": self.id,
             "agent_id": self.agent_id,
             "task_type": self.task_type,
-            "status": self.status.value,
+            "status": _TASK_STATUS_VALUES[self.status],
             "progress": self.progress,
             "created_at": self.created_at.isoformat(),
             "started_at": self.started_at.isoformat() if self.started_at else None,
@@ -193,7 +208,7 @@ class Task:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSystemStatus:
     """Overall agent system status"""
     total_agents: int
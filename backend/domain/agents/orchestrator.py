@@ -4,8 +4,11 @@ Manages agent lifecycle and task distribution
 """
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import time
+import uuid
+import weakref
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Any, Set, Tuple
 
 from domain.agents.models import (
     Agent, Task, TaskRequest, TaskStatus, AgentStatus, AgentSystemStatus
@@ -27,6 +30,8 @@ class AgentRegistry:
         """Initialize agent registry"""
         self._agent_types: Dict[str, type] = {}
         self._agents: Dict[str, BaseAgent] = {}
+        # Snapshot of agent instances, rebuilt after the registry changes
+        self._agents_snapshot: Optional[Tuple[BaseAgent, ...]] = None
     
     def register_agent_type(self, agent_type: str, agent_class: type) -> None:
         """
@@ -65,6 +70,7 @@ class AgentRegistry:
         agent_class = self._agent_types[agent_type]
         agent = agent_class(agent_id=agent_id, **kwargs)
         self._agents[agent_id] = agent
+        self._agents_snapshot = None
         
         logger.info(f"Created agent: {agent_id} ({agent_type})")
         return agent
@@ -73,9 +79,12 @@ class AgentRegistry:
         """Get agent by ID"""
         return self._agents.get(agent_id)
     
-    def list_agents(self) -> List[BaseAgent]:
+    def list_agents(self) -> Tuple[BaseAgent, ...]:
         """List all agent instances"""
-        return list(self._agents.values())
+        snapshot = self._agents_snapshot
+        if snapshot is None:
+            snapshot = self._agents_snapshot = tuple(self._agents.values())
+        return snapshot
     
     def list_agent_types(self) -> List[str]:
         """List available agent types"""
@@ -85,6 +94,7 @@ class AgentRegistry:
         """Remove agent from registry"""
         if agent_id in self._agents:
             del self._agents[agent_id]
+            self._agents_snapshot = None
             logger.info(f"Removed agent: {agent_id}")
             return True
         return False
@@ -96,6 +106,14 @@ class AgentOrchestrator:
     Coordinates agent execution and task management
     """
     
+    # Orchestrators are created per request, so the execution limit and the
+    # references that keep background tasks alive are shared process-wide.
+    # Semaphores are bound to the loop that first waits on them, so one is
+    # created lazily for each running event loop
+    MAX_CONCURRENT_TASKS = 8
+    _execution_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+    _background_tasks: Set["asyncio.Task[None]"] = set()
+    
     def __init__(
         self, 
         registry: AgentRegistry,
@@ -114,6 +132,10 @@ class AgentOrchestrator:
         self.data_access_service = data_access_service
         self.external_data_service = external_data_service
         self._tasks: Dict[str, Task] = {}
+        # (monotonic completion time in ns, task ID) for finished tasks, oldest first
+        self._finished_tasks: Deque[Tuple[int, str]] = deque()
+        # Background executions by task ID, dropped once they finish
+        self._running: Dict[str, "asyncio.Task[None]"] = {}
         self._task_lock = asyncio.Lock()
     
     async def create_agent(
@@ -135,8 +157,7 @@ class AgentOrchestrator:
         Returns:
             Created agent
         """
-        import uuid
-        agent_id = str(uuid.uuid4())
+        agent_id = uuid.uuid4().hex
         
         agent = self.registry.create_agent(
             agent_type=agent_type,
@@ -182,12 +203,17 @@ class AgentOrchestrator:
             parameters=request.parameters
         )
         
-        # Store task
-        async with self._task_lock:
-            self._tasks[task.id] = task
+        # Store task (single dict write, atomic on the event loop; the lock
+        # only guards cleanup_old_tasks' multi-step removal)
+        self._tasks[task.id] = task
         
-        # Execute task asynchronously (don't wait)
-        asyncio.create_task(self._execute_task(task, agent))
+        # Execute task asynchronously (don't wait); it stays pending until an
+        # execution slot is free
+        background = asyncio.create_task(self._execute_task(task, agent))
+        self._background_tasks.add(background)
+        background.add_done_callback(self._background_tasks.discard)
+        self._running[task.id] = background
+        background.add_done_callback(lambda _: self._running.pop(task.id, None))
         
         logger.info(f"Task submitted: {task.id} to agent {agent.agent.name}")
         return task
@@ -200,6 +226,20 @@ class AgentOrchestrator:
             task: Task to execute
             agent: Agent to execute task
         """
+        async with self._get_execution_slots():
+            await self._run_task(task, agent)
+    
+    @classmethod
+    def _get_execution_slots(cls) -> asyncio.Semaphore:
+        """Get the execution limit semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        slots = cls._execution_slots.get(loop)
+        if slots is None:
+            slots = cls._execution_slots[loop] = asyncio.Semaphore(cls.MAX_CONCURRENT_TASKS)
+        return slots
+    
+    async def _run_task(self, task: Task, agent: BaseAgent) -> None:
+        """Run task on agent and record the outcome"""
         try:
             # Mark as running
             task.start()
@@ -212,6 +252,7 @@ class AgentOrchestrator:
             
             # Mark as completed
             task.complete(result)
+            self._finished_tasks.append((time.monotonic_ns(), task.id))
             agent.set_status(AgentStatus.IDLE)
             
             logger.info(f"Task completed: {task.id}")
@@ -219,6 +260,7 @@ class AgentOrchestrator:
         except Exception as e:
             # Mark as failed
             task.fail(str(e))
+            self._finished_tasks.append((time.monotonic_ns(), task.id))
             agent.set_status(AgentStatus.ERROR)
             
             logger.error(f"Task failed: {task.id} - {e}")
@@ -241,6 +283,28 @@ class AgentOrchestrator:
             raise TaskNotFoundError(task_id)
         return task
     
+    async def await_task(self, task_id: str) -> Task:
+        """
+        Wait until a task has finished
+        
+        Args:
+            task_id: Task identifier
+            
+        Returns:
+            Task (completed or failed)
+            
+        Raises:
+            TaskNotFoundError: Task not found
+        """
+        task = await self.get_task_status(task_id)
+        
+        running = self._running.get(task_id)
+        if running is not None:
+            # Shielded so a caller-side timeout does not cancel the execution
+            await asyncio.shield(running)
+        
+        return task
+    
     async def get_task_result(self, task_id: str) -> Dict[str, Any]:
         """
         Get task result
@@ -283,16 +347,17 @@ class AgentOrchestrator:
             if agent.agent.status == AgentStatus.BUSY
         )
         
-        tasks = list(self._tasks.values())
+        # Count tasks per status in a single pass
+        status_counts = Counter(task.status for task in self._tasks.values())
         
         return AgentSystemStatus(
             total_agents=len(agents),
             active_agents=active_agents,
-            total_tasks=len(tasks),
-            pending_tasks=sum(1 for t in tasks if t.status == TaskStatus.PENDING),
-            running_tasks=sum(1 for t in tasks if t.status == TaskStatus.RUNNING),
-            completed_tasks=sum(1 for t in tasks if t.status == TaskStatus.COMPLETED),
-            failed_tasks=sum(1 for t in tasks if t.status == TaskStatus.FAILED)
+            total_tasks=sum(status_counts.values()),
+            pending_tasks=status_counts[TaskStatus.PENDING],
+            running_tasks=status_counts[TaskStatus.RUNNING],
+            completed_tasks=status_counts[TaskStatus.COMPLETED],
+            failed_tasks=status_counts[TaskStatus.FAILED]
         )
     
     async def cleanup_old_tasks(self, max_age_hours: int = 24) -> int:
@@ -305,18 +370,17 @@ class AgentOrchestrator:
         Returns:
             Number of tasks cleaned up
         """
-        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+        cutoff_ns = time.monotonic_ns() - max_age_hours * 3_600_000_000_000
         
+        removed = 0
         async with self._task_lock:
-            tasks_to_remove = [
-                task_id for task_id, task in self._tasks.items()
-                if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]
-                and task.completed_at
-                and task.completed_at < cutoff
-            ]
-            
-            for task_id in tasks_to_remove:
-                del self._tasks[task_id]
+            # Finished tasks are recorded in completion order, so only the
+            # expired prefix needs to be visited
+            finished = self._finished_tasks
+            while finished and finished[0][0] < cutoff_ns:
+                _, task_id = finished.popleft()
+                self._tasks.pop(task_id, None)
+                removed += 1
         
-        logger.info(f"Cleaned up {len(tasks_to_remove)} old tasks")
-        return len(tasks_to_remove)
\ No newline at end of file
+        logger.info(f"Cleaned up {removed} old tasks")
+        return removed
\ No newline at end of file
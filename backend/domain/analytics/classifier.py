@@ -2,6 +2,8 @@
 Document Classifier
 Pure business logic for document classification
 """
+import functools
+import json
 import logging
 from typing import Dict, Any, Callable, Awaitable
 from domain.analytics.models import Classification, DocumentCategory
@@ -9,6 +11,18 @@ from domain.analytics.exceptions import ClassificationError
 
 logger = logging.getLogger(__name__)
 
+# Case-insensitive lookup from category name to enum member
+_CATEGORY_BY_NAME = {cat.value.lower(): cat for cat in DocumentCategory}
+
+
+@functools.lru_cache(maxsize=32)
+def _category_for_name(category_name: str) -> DocumentCategory:
+    """Resolve an LLM-returned category name (defaults to correspondence)"""
+    return _CATEGORY_BY_NAME.get(
+        category_name.lower(),
+        DocumentCategory.CORRESPONDENCE_OTHER
+    )
+
 
 class DocumentClassifier:
     """
@@ -26,6 +40,38 @@ class DocumentClassifier:
         DocumentCategory.CORRESPONDENCE_OTHER: "Emails, letters, memos, reports, other documents"
     }
     
+    # Numbered category list rendered once for the classification prompt
+    _CATEGORIES_LIST = "\n".join(
+        f"{i+1}. {cat.value} - {desc}"
+        for i, (cat, desc) in enumerate(CATEGORY_DESCRIPTIONS.items())
+    )
+    
+    # Prompt with the constant category section already rendered; only the
+    # filename and content are substituted per document
+    _PROMPT_TEMPLATE = (
+        "Analyze this document and classify it into one of these categories:\n\n"
+        "Categories:\n"
+        + _CATEGORIES_LIST
+        + """
+
+Document Filename: {filename}
+
+Document Content (first 3000 characters):
+{content}
+
+Respond in JSON format:
+{{
+    "category": "category name exactly as listed",
+    "sub_type": "specific document sub-type",
+    "confidence": 0.0-1.0,
+    "detected_language": "ISO language code",
+    "reasoning": "brief explanation"
+}}"""
+    )
+    
+    _SYSTEM_PROMPT = """You are a document classification expert. Analyze documents accurately regardless of language.
+Return ONLY valid JSON with no additional text. Be precise and confident in your classifications."""
+    
     # Subtypes by category
     SUBTYPES = {
         DocumentCategory.AGREEMENTS_CONTRACTS: [
@@ -108,48 +154,22 @@ class DocumentClassifier:
     
     def _build_classification_prompt(self, content: str, filename: str) -> str:
         """Build classification prompt"""
-        categories_list = "\n".join([
-            f"{i+1}. {cat.value} - {desc}"
-            for i, (cat, desc) in enumerate(self.CATEGORY_DESCRIPTIONS.items())
-        ])
-        
-        return f"""Analyze this document and classify it into one of these categories:
-
-Categories:
-{categories_list}
-
-Document Filename: {filename}
-
-Document Content (first 3000 characters):
-{content}
-
-Respond in JSON format:
-{{
-    "category": "category name exactly as listed",
-    "sub_type": "specific document sub-type",
-    "confidence": 0.0-1.0,
-    "detected_language": "ISO language code",
-    "reasoning": "brief explanation"
-}}"""
+        return self._PROMPT_TEMPLATE.format(filename=filename, content=content)
     
     def _get_system_prompt(self) -> str:
         """Get system prompt for classification"""
-        return """You are a document classification expert. Analyze documents accurately regardless of language.
-Return ONLY valid JSON with no additional text. Be precise and confident in your classifications."""
+        return self._SYSTEM_PROMPT
     
     def _parse_classification_response(self, response: str) -> Classification:
         """Parse LLM response into Classification object"""
-        import json
-        
         # Clean response
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-        response = response.strip()
+        response = (
+            response.strip()
+            .removeprefix("```json")
+            .removeprefix("```")
+            .removesuffix("```")
+            .strip()
+        )
         
         # Parse JSON
         try:
@@ -171,12 +191,7 @@ Return ONLY valid JSON with no additional text. Be precise and confident in your
     
     def _map_category_name(self, category_name: str) -> DocumentCategory:
         """Map category name string to enum"""
-        for category in DocumentCategory:
-            if category.value.lower() == category_name.lower():
-                return category
-        
-        # Default to correspondence if no match
-        return DocumentCategory.CORRESPONDENCE_OTHER
+        return _category_for_name(category_name)
     
     def get_taxonomy(self) -> Dict[str, Any]:
         """Get classification taxonomy"""
@@ -2,8 +2,12 @@
 Metadata Extractor
 Pure business logic for extracting structured data from documents
 """
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List, Callable, Awaitable
+from itertools import chain
+from typing import Dict, Any, Iterable, Iterator, List, Callable, Awaitable, Optional
 from domain.analytics.models import (
     ExtractedMetadata, ExtractedDate, MonetaryValue, Entity, KeyTerm
 )
@@ -11,6 +15,11 @@ from domain.analytics.exceptions import ExtractionError
 
 logger = logging.getLogger(__name__)
 
+# Returned when an LLM response cannot be parsed (read-only; never cached)
+_EMPTY_EXTRACTION: Dict[str, Any] = {
+    "dates": [], "monetary_values": [], "entities": [], "key_terms": []
+}
+
 
 class MetadataExtractor:
     """
@@ -22,14 +31,36 @@ class MetadataExtractor:
     CHUNK_SIZE = 2000  # characters
     CHUNK_OVERLAP = 500  # characters
     
-    def __init__(self, llm_func: Callable[[str, str], Awaitable[str]]):
+    # Maximum concurrent LLM calls per document
+    MAX_PARALLEL_CHUNKS = 8
+    
+    # Up to this many uncached chunks are extracted with a single LLM call
+    MAX_BATCHED_CHUNKS = 5
+    
+    # Bump when the extraction prompt changes to invalidate cached results
+    PROMPT_VERSION = "v1"
+    
+    _SYSTEM_PROMPT = """You are a precise data extraction expert. Extract only factual information.
+Return ONLY valid JSON. Use standard formats (ISO dates, currency codes).
+Entity roles must be in English regardless of document language."""
+    
+    def __init__(
+        self,
+        llm_func: Callable[[str, str], Awaitable[str]],
+        cache: Optional[Any] = None,
+        model_id: str = ""
+    ):
         """
         Initialize extractor with LLM function
         
         Args:
             llm_func: Async LLM function (prompt, system_prompt) -> response
+            cache: Optional extraction cache with get(key) / set(key, value)
+            model_id: Model behind llm_func, part of the cache key
         """
         self.llm_func = llm_func
+        self.cache = cache
+        self.model_id = model_id
     
     async def extract(
         self,
@@ -55,37 +86,44 @@ class MetadataExtractor:
             
             logger.info(f"Extracting metadata from {len(chunks)} chunks")
             
-            # Process each chunk
-            all_dates = []
-            all_monetary = []
-            all_entities = []
-            all_terms = []
+            chunk_results = await self._extract_chunks(chunks, filename)
+            
+            valid_results = []
+            for i, chunk_result in enumerate(chunk_results):
+                if isinstance(chunk_result, Exception):
+                    logger.warning(f"Skipping chunk {i+1}, extraction failed: {chunk_result}")
+                    continue
+                valid_results.append(chunk_result)
             
-            for i, chunk in enumerate(chunks):
-                chunk_result = await self._extract_from_chunk(chunk, filename, i+1)
-                
-                all_dates.extend(chunk_result.get("dates", []))
-                all_monetary.extend(chunk_result.get("monetary_values", []))
-                all_entities.extend(chunk_result.get("entities", []))
-                all_terms.extend(chunk_result.get("key_terms", []))
+            failed = len(chunk_results) - len(valid_results)
+            if chunks and not valid_results:
+                logger.error(f"Metadata extraction failed: all {failed} chunks failed")
+                raise ExtractionError(f"Extraction failed: all {failed} chunks failed")
+            
+            def collect(field: str) -> Iterator[Dict]:
+                return chain.from_iterable(r.get(field, ()) for r in valid_results)
             
             # Deduplicate and create metadata object
             metadata = ExtractedMetadata(
-                dates=self._deduplicate_dates(all_dates),
-                monetary_values=self._deduplicate_monetary(all_monetary),
-                entities=self._deduplicate_entities(all_entities),
-                key_terms=self._deduplicate_terms(all_terms),
-                chunks_processed=len(chunks)
+                dates=self._deduplicate_dates(collect("dates")),
+                monetary_values=self._deduplicate_monetary(collect("monetary_values")),
+                entities=self._deduplicate_entities(collect("entities")),
+                key_terms=self._deduplicate_terms(collect("key_terms")),
+                chunks_processed=len(chunks),
+                chunks_failed=failed
             )
             
             logger.info(
                 f"Metadata extracted: {len(metadata.dates)} dates, "
                 f"{len(metadata.monetary_values)} monetary values, "
-                f"{len(metadata.entities)} entities"
+                f"{len(metadata.entities)} entities "
+                f"({failed}/{len(chunks)} chunks failed)"
             )
             
             return metadata
             
+        except ExtractionError:
+            raise
         except Exception as e:
             logger.error(f"Metadata extraction failed: {e}")
             raise ExtractionError(f"Extraction failed: {str(e)}")
@@ -103,13 +141,23 @@ class MetadataExtractor:
             
             # Try to break at sentence boundary
             if end < len(content):
-                for i in range(end - 1, max(start + self.CHUNK_SIZE - 200, start), -1):
-                    if content[i] in '.!?':
-                        end = i + 1
-                        break
+                window_start = max(start + self.CHUNK_SIZE - 200, start) + 1
+                boundary = max(
+                    content.rfind('.', window_start, end),
+                    content.rfind('!', window_start, end),
+                    content.rfind('?', window_start, end)
+                )
+                if boundary != -1:
+                    end = boundary + 1
+            
+            # A tail no longer than the overlap lies entirely inside the
+            # previous chunk, so extracting it again would only repeat results
+            if chunks and len(content) - start <= self.CHUNK_OVERLAP:
+                break
             
             chunk = content[start:end].strip()
-            if chunk:
+            # Skip chunks with nothing to extract (whitespace, rules, dots)
+            if chunk and any(c.isalnum() for c in chunk):
                 chunks.append(chunk)
             
             # Move start with overlap
@@ -126,6 +174,10 @@ class MetadataExtractor:
         chunk_num: int
     ) -> Dict[str, Any]:
         """Extract metadata from a single chunk"""
+        # Nothing to extract from text without letters or digits
+        if not any(c.isalnum() for c in chunk):
+            return _EMPTY_EXTRACTION
+        
         prompt = f"""Extract structured information from this document section.
 Work with ANY language - extract data regardless of language.
 
@@ -163,38 +215,200 @@ IMPORTANT:
 - Only extract high-confidence information
 - Return empty arrays if nothing found"""
         
-        system_prompt = """You are a precise data extraction expert. Extract only factual information.
-Return ONLY valid JSON. Use standard formats (ISO dates, currency codes).
-Entity roles must be in English regardless of document language."""
-        
-        response = await self.llm_func(prompt, system_prompt)
+        response = await self.llm_func(prompt, self._SYSTEM_PROMPT)
         
         # Parse response
         return self._parse_extraction_response(response)
     
+    async def _extract_from_chunk_batch(
+        self,
+        chunks: List[str],
+        chunk_nums: List[int],
+        filename: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Extract metadata from several chunks with one LLM call
+        
+        Returns:
+            Per-chunk results in input order, or None if the response
+            does not contain exactly one result per chunk
+        """
+        sections = "\n\n".join(
+            f"--- CHUNK {chunk_num} ---\n{chunk}"
+            for chunk_num, chunk in zip(chunk_nums, chunks)
+        )
+        
+        prompt = f"""Extract structured information from each of these document sections.
+Work with ANY language - extract data regardless of language.
+
+Extract from every section:
+1. **Dates** with context (contract dates, deadlines, etc.)
+2. **Monetary Values** with ISO currency codes (USD, EUR, ILS, etc.)
+3. **Entities** (people, organizations, addresses) with roles in ENGLISH
+4. **Key Terms** (important clauses, conditions)
+
+Document: {filename}
+
+{sections}
+
+Respond in JSON with one entry per section, in the order given:
+{{
+    "chunks": [
+        {{
+            "dates": [
+                {{"value": "YYYY-MM-DD", "context": "contract_start", "confidence": 0.9}}
+            ],
+            "monetary_values": [
+                {{"amount": 1000.0, "currency": "USD", "context": "monthly_rent", "confidence": 0.9}}
+            ],
+            "entities": [
+                {{"name": "Entity Name", "type": "person|organization|address", "role": "tenant|landlord|party", "confidence": 0.9}}
+            ],
+            "key_terms": [
+                {{"term": "Important clause", "category": "obligation", "context": "Brief context", "importance": 0.8}}
+            ]
+        }}
+    ]
+}}
+
+IMPORTANT:
+- Return exactly {len(chunks)} entries in "chunks"
+- Use ISO 4217 currency codes only (USD, EUR, ILS, GBP, etc.)
+- Entity roles must be in ENGLISH
+- Only extract high-confidence information
+- Return empty arrays if nothing found"""
+        
+        response = await self.llm_func(prompt, self._SYSTEM_PROMPT)
+        
+        data = self._parse_extraction_response(response)
+        results = data.get("chunks") if isinstance(data, dict) else None
+        if (
+            not isinstance(results, list)
+            or len(results) != len(chunks)
+            or not all(isinstance(result, dict) for result in results)
+        ):
+            return None
+        return results
+    
+    async def _extract_chunks(
+        self,
+        chunks: List[str],
+        filename: str
+    ) -> List[Any]:
+        """
+        Extract metadata for all chunks, in chunk order
+        
+        Cached chunks are reused; a small set of remaining chunks is sent as
+        one batched LLM call, otherwise chunks are extracted concurrently.
+        Entries are per-chunk result dicts, or the exception that chunk raised.
+        """
+        results: List[Any] = [None] * len(chunks)
+        cache_keys: List[Optional[str]] = [None] * len(chunks)
+        pending = []
+        
+        if self.cache is not None:
+            cache_keys = [self._cache_key(chunk) for chunk in chunks]
+            
+            def lookup() -> List[Optional[Dict[str, Any]]]:
+                return [self.cache.get(key) for key in cache_keys]
+            
+            # Cache reads and writes hit the disk; keep them off the event loop
+            cached = await asyncio.to_thread(lookup)
+        else:
+            cached = [None] * len(chunks)
+        
+        for i, hit in enumerate(cached):
+            if hit is not None:
+                results[i] = hit
+            else:
+                pending.append(i)
+        uncached = list(pending)
+        
+        if 1 < len(pending) <= self.MAX_BATCHED_CHUNKS:
+            try:
+                batch = await self._extract_from_chunk_batch(
+                    [chunks[i] for i in pending],
+                    [i + 1 for i in pending],
+                    filename
+                )
+            except Exception as e:
+                logger.warning(f"Batched extraction failed, extracting chunks individually: {e}")
+                batch = None
+            
+            if batch is not None:
+                for i, result in zip(pending, batch):
+                    results[i] = result
+                pending = []
+            else:
+                logger.info("Batched extraction response unusable, extracting chunks individually")
+        
+        if pending:
+            # Extract remaining chunks concurrently
+            semaphore = asyncio.Semaphore(self.MAX_PARALLEL_CHUNKS)
+            
+            async def extract_chunk(i: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._extract_from_chunk(chunks[i], filename, i + 1)
+            
+            extracted = await asyncio.gather(
+                *(extract_chunk(i) for i in pending),
+                return_exceptions=True
+            )
+            for i, result in zip(pending, extracted):
+                results[i] = result
+        
+        if self.cache is not None:
+            # Store freshly extracted results (not failures or unparsable responses)
+            fresh = [
+                (cache_keys[i], results[i]) for i in uncached
+                if isinstance(results[i], dict) and results[i] is not _EMPTY_EXTRACTION
+            ]
+            
+            def store() -> None:
+                for key, result in fresh:
+                    self.cache.set(key, result)
+            
+            if fresh:
+                await asyncio.to_thread(store)
+        
+        return results
+    
+    def _cache_key(self, chunk: str) -> str:
+        """
+        Content hash of chunk plus model and prompt version (length-prefixed)
+        
+        Whitespace runs are collapsed first, so chunks that differ only in
+        line wrapping or indentation (common across templated documents and
+        re-OCRed scans) share an entry.
+        """
+        normalized = " ".join(chunk.split())
+        digest = hashlib.sha256()
+        for part in (self.model_id, self.PROMPT_VERSION, normalized):
+            data = part.encode()
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+    
     def _parse_extraction_response(self, response: str) -> Dict[str, Any]:
         """Parse LLM extraction response"""
-        import json
-        
         # Clean response
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-        response = response.strip()
+        response = (
+            response.strip()
+            .removeprefix("```json")
+            .removeprefix("```")
+            .removesuffix("```")
+            .strip()
+        )
         
         try:
             data = json.loads(response)
         except json.JSONDecodeError:
             logger.warning("Failed to parse extraction response, returning empty")
-            return {"dates": [], "monetary_values": [], "entities": [], "key_terms": []}
+            return _EMPTY_EXTRACTION
         
         return data
     
-    def _deduplicate_dates(self, dates: List[Dict]) -> List[ExtractedDate]:
+    def _deduplicate_dates(self, dates: Iterable[Dict]) -> List[ExtractedDate]:
         """Deduplicate and convert dates"""
         seen = set()
         result = []
@@ -212,7 +426,7 @@ Entity roles must be in English regardless of document language."""
         
         return result
     
-    def _deduplicate_monetary(self, values: List[Dict]) -> List[MonetaryValue]:
+    def _deduplicate_monetary(self, values: Iterable[Dict]) -> List[MonetaryValue]:
         """Deduplicate and convert monetary values"""
         seen = set()
         result = []
@@ -230,7 +444,7 @@ Entity roles must be in English regardless of document language."""
         
         return result
     
-    def _deduplicate_entities(self, entities: List[Dict]) -> List[Entity]:
+    def _deduplicate_entities(self, entities: Iterable[Dict]) -> List[Entity]:
         """Deduplicate and convert entities"""
         seen = set()
         result = []
@@ -252,7 +466,7 @@ Entity roles must be in English regardless of document language."""
         
         return result
     
-    def _deduplicate_terms(self, terms: List[Dict]) -> List[KeyTerm]:
+    def _deduplicate_terms(self, terms: Iterable[Dict]) -> List[KeyTerm]:
         """Deduplicate and convert key terms"""
         seen = set()
         result = []
@@ -262,8 +476,9 @@ Entity roles must be in English regardless of document language."""
             if not term:
                 continue
             
-            if term.lower() not in seen:
-                seen.add(term.lower())
+            key = term.lower()
+            if key not in seen:
+                seen.add(key)
                 result.append(KeyTerm(
                     term=term,
                     category=t.get("category", "unknown"),
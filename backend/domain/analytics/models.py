@@ -18,7 +18,7 @@ class DocumentCategory(str, Enum):
     CORRESPONDENCE_OTHER = "Correspondence & Other"
 
 
-@dataclass
+@dataclass(slots=True)
 class Classification:
     """Document classification result"""
     category: DocumentCategory
@@ -39,7 +39,7 @@ class Classification:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedDate:
     """Extracted date with context"""
     value: str  # ISO 8601 format
@@ -56,7 +56,7 @@ class ExtractedDate:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MonetaryValue:
     """Extracted monetary value"""
     amount: float
@@ -73,7 +73,7 @@ class MonetaryValue:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Extracted entity (person, organization, location)"""
     name: str
@@ -94,7 +94,7 @@ class Entity:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyTerm:
     """Important term or clause"""
     term: str
@@ -111,7 +111,7 @@ class KeyTerm:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedMetadata:
     """Complete extracted metadata from document"""
     dates: List[ExtractedDate] = field(default_factory=list)
@@ -121,16 +121,18 @@ class ExtractedMetadata:
     extracted_at: datetime = field(default_factory=datetime.utcnow)
     extraction_method: str = "llm"
     chunks_processed: int = 0
+    chunks_failed: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "dates": [d.to_dict() for d in self.dates],
-            "monetary_values": [m.to_dict() for m in self.monetary_values],
-            "entities": [e.to_dict() for e in self.entities],
-            "key_terms": [k.to_dict() for k in self.key_terms],
+            "dates": list(map(ExtractedDate.to_dict, self.dates)),
+            "monetary_values": list(map(MonetaryValue.to_dict, self.monetary_values)),
+            "entities": list(map(Entity.to_dict, self.entities)),
+            "key_terms": list(map(KeyTerm.to_dict, self.key_terms)),
             "extracted_at": self.extracted_at.isoformat(),
             "extraction_method": self.extraction_method,
-            "chunks_processed": self.chunks_processed
+            "chunks_processed": self.chunks_processed,
+            "chunks_failed": self.chunks_failed
         }
     
     @property
@@ -144,7 +146,7 @@ class ExtractedMetadata:
         ])
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentAnalytics:
     """Complete analytics for a document"""
     document_id: str
@@ -163,7 +165,7 @@ class DocumentAnalytics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioSummary:
     """Portfolio-wide analytics summary"""
     total_documents: int
@@ -3,7 +3,7 @@ Analytics Service
 Orchestrates classification and metadata extraction
 """
 import logging
-from typing import Callable, Awaitable
+from typing import Any, Callable, Awaitable, Optional
 
 from domain.analytics.models import DocumentAnalytics, Classification, ExtractedMetadata
 from domain.analytics.classifier import DocumentClassifier
@@ -23,7 +23,9 @@ class AnalyticsService:
     def __init__(
         self,
         llm_func: Callable[[str, str], Awaitable[str]],
-        min_confidence: float = 0.6
+        min_confidence: float = 0.6,
+        extraction_cache: Optional[Any] = None,
+        model_id: str = ""
     ):
         """
         Initialize analytics service
@@ -31,9 +33,15 @@ class AnalyticsService:
         Args:
             llm_func: Async LLM function
             min_confidence: Minimum confidence for validation
+            extraction_cache: Optional cache for per-chunk extraction results
+            model_id: Model behind llm_func (scopes cached extractions)
         """
         self.classifier = DocumentClassifier(llm_func)
-        self.extractor = MetadataExtractor(llm_func)
+        self.extractor = MetadataExtractor(
+            llm_func,
+            cache=extraction_cache,
+            model_id=model_id
+        )
         self.validator = DataValidator(min_confidence)
     
     async def analyze_document(
@@ -137,7 +145,8 @@ class AnalyticsService:
             key_terms=self.validator.validate_key_terms(metadata.key_terms),
             extracted_at=metadata.extracted_at,
             extraction_method=metadata.extraction_method,
-            chunks_processed=metadata.chunks_processed
+            chunks_processed=metadata.chunks_processed,
+            chunks_failed=metadata.chunks_failed
         )
         
         return validated
@@ -2,11 +2,12 @@
 Data Validator
 Validates and normalizes extracted metadata
 """
+import functools
 import logging
 import re
+from dataclasses import replace
 from typing import List
 from datetime import datetime
-from dateutil import parser as date_parser
 
 from domain.analytics.models import (
     ExtractedDate, MonetaryValue, Entity, KeyTerm
@@ -14,6 +15,73 @@ from domain.analytics.models import (
 
 logger = logging.getLogger(__name__)
 
+# Cheap shape check run before datetime.fromisoformat (YYYY-MM-DD prefix)
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Standard entity roles (English only)
+_STANDARD_ROLES = frozenset({
+    'tenant', 'landlord', 'owner', 'buyer', 'seller', 'employer',
+    'employee', 'contractor', 'client', 'vendor', 'partner', 'party_a',
+    'party_b', 'insurer', 'insured', 'lender', 'borrower'
+})
+
+# Common currency variants -> ISO 4217 code
+_CURRENCY_MAPPINGS = {
+    'DOLLAR': 'USD',
+    'DOLLARS': 'USD',
+    '$': 'USD',
+    'EURO': 'EUR',
+    'EUROS': 'EUR',
+    '€': 'EUR',
+    'SHEKEL': 'ILS',
+    'SHEKELS': 'ILS',
+    '₪': 'ILS',
+    'POUND': 'GBP',
+    'POUNDS': 'GBP',
+    '£': 'GBP'
+}
+
+# Common role mappings (Hebrew to English)
+_ROLE_MAPPINGS = {
+    'שוכר': 'tenant',
+    'משכיר': 'landlord',
+    'בעלים': 'owner',
+    'קונה': 'buyer',
+    'מוכר': 'seller',
+    'מעסיק': 'employer',
+    'עובד': 'employee',
+    'קבלן': 'contractor',
+    'לקוח': 'client',
+    'ספק': 'vendor',
+    'שותף': 'partner'
+}
+
+# Single lookup table: standard roles map to themselves, Hebrew roles to English
+_ROLE_NORMALIZE = {
+    **{r: r for r in _STANDARD_ROLES},
+    **_ROLE_MAPPINGS
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_currency(currency: str) -> str:
+    """Map a currency variant to its ISO 4217 code ('UNKNOWN' if unmapped)"""
+    return _CURRENCY_MAPPINGS.get(currency.upper(), 'UNKNOWN')
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_role(role: str) -> str:
+    """Normalize an entity role to the English standard"""
+    role = role.strip()
+    
+    # Exact hit covers standard roles and Hebrew (which has no case)
+    normalized = _ROLE_NORMALIZE.get(role)
+    if normalized is not None:
+        return normalized
+    
+    role_lower = role.lower()
+    return _ROLE_NORMALIZE.get(role_lower, role_lower)
+
 
 class DataValidator:
     """
@@ -28,11 +96,20 @@ class DataValidator:
     }
     
     # Standard entity roles (English only)
-    STANDARD_ROLES = {
-        'tenant', 'landlord', 'owner', 'buyer', 'seller', 'employer',
-        'employee', 'contractor', 'client', 'vendor', 'partner', 'party_a',
-        'party_b', 'insurer', 'insured', 'lender', 'borrower'
-    }
+    STANDARD_ROLES = _STANDARD_ROLES
+    
+    # Common currency variants -> ISO 4217 code
+    CURRENCY_MAPPINGS = _CURRENCY_MAPPINGS
+    
+    # Common role mappings (Hebrew to English)
+    ROLE_MAPPINGS = _ROLE_MAPPINGS
+    
+    # Entity names too generic to be useful (compared lowercased)
+    GENERIC_NAMES = frozenset({
+        'unknown', 'לא ידוע', 'המושכר', 'סניף', 'branch',
+        'location', 'address', 'מיקום', 'כתובת', 'company',
+        'person', 'entity'
+    })
     
     def __init__(self, min_confidence: float = 0.6):
         """
@@ -52,7 +129,10 @@ class DataValidator:
             if date.confidence < self.min_confidence:
                 continue
             
-            # Validate ISO format
+            # Validate ISO format (reject obvious non-dates without raising)
+            if not _ISO_DATE_RE.match(date.value):
+                logger.warning(f"Invalid date format: {date.value}")
+                continue
             try:
                 datetime.fromisoformat(date.value)
                 validated.append(date)
@@ -83,12 +163,10 @@ class DataValidator:
                 # Try to map common variants
                 currency = self._normalize_currency(currency)
             
-            validated.append(MonetaryValue(
-                amount=value.amount,
-                currency=currency,
-                context=value.context,
-                confidence=value.confidence
-            ))
+            # Reuse the value unless normalization changed it
+            if currency != value.currency:
+                value = replace(value, currency=currency)
+            validated.append(value)
         
         return validated
     
@@ -108,13 +186,10 @@ class DataValidator:
             # Normalize role to English
             role = self._normalize_role(entity.role)
             
-            validated.append(Entity(
-                name=entity.name,
-                type=entity.type,
-                role=role,
-                confidence=entity.confidence,
-                coordinates=entity.coordinates
-            ))
+            # Reuse the entity unless normalization changed it
+            if role != entity.role:
+                entity = replace(entity, role=role)
+            validated.append(entity)
         
         return validated
     
@@ -137,55 +212,12 @@ class DataValidator:
     
     def _normalize_currency(self, currency: str) -> str:
         """Normalize currency code"""
-        # Common mappings
-        mappings = {
-            'DOLLAR': 'USD',
-            'DOLLARS': 'USD',
-            '$': 'USD',
-            'EURO': 'EUR',
-            'EUROS': 'EUR',
-            '€': 'EUR',
-            'SHEKEL': 'ILS',
-            'SHEKELS': 'ILS',
-            '₪': 'ILS',
-            'POUND': 'GBP',
-            'POUNDS': 'GBP',
-            '£': 'GBP'
-        }
-        
-        return mappings.get(currency.upper(), 'UNKNOWN')
+        return _normalize_currency(currency)
     
     def _normalize_role(self, role: str) -> str:
         """Normalize entity role to English standard"""
-        role_lower = role.lower().strip()
-        
-        # Already standard
-        if role_lower in self.STANDARD_ROLES:
-            return role_lower
-        
-        # Common mappings (Hebrew to English)
-        mappings = {
-            'שוכר': 'tenant',
-            'משכיר': 'landlord',
-            'בעלים': 'owner',
-            'קונה': 'buyer',
-            'מוכר': 'seller',
-            'מעסיק': 'employer',
-            'עובד': 'employee',
-            'קבלן': 'contractor',
-            'לקוח': 'client',
-            'ספק': 'vendor',
-            'שותף': 'partner'
-        }
-        
-        return mappings.get(role, role_lower)
+        return _normalize_role(role)
     
     def _is_generic_name(self, name: str) -> bool:
         """Check if name is too generic"""
-        generic = [
-            'unknown', 'לא ידוע', 'המושכר', 'סניף', 'branch',
-            'location', 'address', 'מיקום', 'כתובת', 'company',
-            'person', 'entity'
-        ]
-        
-        return name.lower().strip() in generic
\ No newline at end of file
+        return name.lower().strip() in self.GENERIC_NAMES
@@ -8,6 +8,9 @@ from typing import List, Literal, Optional
 from enum import Enum
 import uuid
 
+# Bound once; used for message and conversation timestamps
+_utcnow = datetime.utcnow
+
 
 class MessageRole(str, Enum):
     """Message role enumeration"""
@@ -15,7 +18,7 @@ class MessageRole(str, Enum):
     ASSISTANT = "assistant"
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     """Source citation for message responses"""
     document_id: str
@@ -25,20 +28,20 @@ class Source:
     excerpt: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Chat message entity"""
     id: str
     role: MessageRole
     content: str
     sources: List[Source] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_utcnow)
     
     @classmethod
     def create_user_message(cls, content: str, message_id: Optional[str] = None) -> "Message":
         """Create a user message"""
         return cls(
-            id=message_id or str(uuid.uuid4()),
+            id=message_id or uuid.uuid4().hex,
             role=MessageRole.USER,
             content=content
         )
@@ -52,14 +55,14 @@ class Message:
     ) -> "Message":
         """Create an assistant message"""
         return cls(
-            id=message_id or str(uuid.uuid4()),
+            id=message_id or uuid.uuid4().hex,
             role=MessageRole.ASSISTANT,
             content=content,
             sources=sources or []
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """Chat conversation entity"""
     id: str
@@ -71,9 +74,9 @@ class Conversation:
     @classmethod
     def create_new(cls, title: str, conversation_id: Optional[str] = None) -> "Conversation":
         """Create a new conversation"""
-        now = datetime.utcnow()
+        now = _utcnow()
         return cls(
-            id=conversation_id or str(uuid.uuid4()),
+            id=conversation_id or uuid.uuid4().hex,
             title=title,
             created_at=now,
             updated_at=now
@@ -82,14 +85,14 @@ class Conversation:
     def add_message(self, message: Message) -> None:
         """Add a message to the conversation"""
         self.messages.append(message)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _utcnow()
     
     def get_last_messages(self, count: int = 10) -> List[Message]:
         """Get the last N messages for context"""
         return self.messages[-count:] if self.messages else []
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     """Response from chat service"""
     conversation_id: str
@@ -99,7 +102,7 @@ class ChatResponse:
     agent_used: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSummary:
     """Summary of conversation for listing"""
     id: str
@@ -0,0 +1,112 @@
+"""
+Chat Response Cache
+In-memory LRU cache for RAG query responses
+"""
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.chat.models import Source
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Exact-match cache for RAG responses
+    Keys are hashes of the whitespace-normalized query, the resolved query
+    parameters and the document scope; the cache is cleared when the corpus
+    or RAG engine changes, and entries expire after a TTL as a backstop
+    """
+    
+    MAX_ENTRIES = 256
+    TTL_SECONDS = 300
+    
+    def __init__(
+        self,
+        max_entries: int = MAX_ENTRIES,
+        ttl_seconds: float = TTL_SECONDS
+    ):
+        """
+        Initialize response cache
+        
+        Args:
+            max_entries: Maximum cached responses before LRU eviction
+            ttl_seconds: Seconds before an entry expires
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str, List[Source]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+    
+    @staticmethod
+    def make_key(
+        query: str,
+        query_params: Dict[str, Any],
+        document_ids: Optional[List[str]] = None
+    ) -> str:
+        """Build cache key from query, resolved query parameters and document scope"""
+        params = json.dumps(query_params, sort_keys=True, default=str)
+        digest = hashlib.sha256()
+        for part in (params, " ".join(query.split()), *sorted(document_ids or ())):
+            data = part.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[str, List[Source]]]:
+        """
+        Get cached response
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Tuple of (response_content, sources) or None on miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        
+        stored_at, response_content, sources = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self._misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return response_content, list(sources)
+    
+    def set(self, key: str, response_content: str, sources: List[Source]) -> None:
+        """
+        Store response
+        
+        Args:
+            key: Cache key from make_key
+            response_content: RAG response text
+            sources: Sources attached to the response
+        """
+        self._entries[key] = (time.monotonic(), response_content, list(sources))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        self._entries.clear()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics"""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0
+        }
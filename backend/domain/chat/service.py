@@ -2,13 +2,15 @@
 Chat Service
 Business logic for chat and conversation management
 """
+import asyncio
 import logging
-from typing import List, Optional, TYPE_CHECKING, AsyncGenerator
+from typing import List, Optional, TYPE_CHECKING, AsyncGenerator, Awaitable
 from datetime import datetime
 
 from domain.chat.models import (
     Conversation, Message, ChatResponse, ConversationSummary, Source, MessageRole
 )
+from domain.chat.response_cache import ResponseCache
 from domain.chat.exceptions import (
     ConversationNotFoundError,
     MessageProcessingError,
@@ -36,7 +38,8 @@ class ChatService:
         chat_storage: 'ChatStorage',
         rag_engine: Optional['RAGEngine'] = None,
         agent_orchestrator: Optional['AgentOrchestrator'] = None,
-        document_service: Optional['DocumentService'] = None
+        document_service: Optional['DocumentService'] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Initialize chat service
@@ -46,11 +49,13 @@ class ChatService:
             agent_orchestrator: Agent orchestrator for agent tasks (optional)
             document_service: Document service for document access (optional)
             chat_storage: Chat storage for conversation persistence
+            response_cache: Cache for repeated RAG queries (optional)
         """
         self.rag_engine = rag_engine
         self.agent_orchestrator = agent_orchestrator
         self.document_service = document_service
         self.chat_storage = chat_storage
+        self.response_cache = response_cache
     
     async def send_message(
         self,
@@ -104,7 +109,7 @@ class ChatService:
                 # Route to agent orchestrator
                 if not self.agent_orchestrator:
                     raise MessageProcessingError("Agent orchestrator not available. Please configure the system properly.")
-                response_content, sources = await self._process_with_agent(
+                process = self._process_with_agent(
                     message=message,
                     agent_id=agent_id,
                     conversation=conversation,
@@ -114,12 +119,24 @@ class ChatService:
                 # Route to RAG engine
                 if not self.rag_engine:
                     raise MessageProcessingError("RAG engine not available. Please ensure the system is properly initialized and OpenAI API key is configured.")
-                response_content, sources = await self._process_with_rag(
+                process = self._process_with_rag(
                     message=message,
                     conversation=conversation,
                     document_ids=document_ids
                 )
             
+            # Persist the user turn while the message is processed; both are
+            # settled before either failure is raised
+            saved, processed = await asyncio.gather(
+                self._save_user_turn(conversation, is_new=not conversation_id),
+                process,
+                return_exceptions=True
+            )
+            for outcome in (processed, saved):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            response_content, sources = processed
+            
             # Create assistant message
             assistant_message = Message.create_assistant_message(
                 content=response_content,
@@ -180,6 +197,7 @@ class ChatService:
         if len(message.strip()) < 2:
             raise InvalidMessageError("Message too short")
         
+        user_turn_saved: Optional[asyncio.Task] = None
         try:
             # Get or create conversation
             if conversation_id:
@@ -195,8 +213,11 @@ class ChatService:
             user_message = Message.create_user_message(message)
             conversation.add_message(user_message)
             
-            # Save conversation with user message immediately
-            await self.chat_storage.save_conversation(conversation)
+            # Save conversation with user message; the write overlaps the
+            # start of response generation and is awaited before the final save
+            user_turn_saved = asyncio.create_task(
+                self._save_user_turn(conversation, is_new=not conversation_id)
+            )
             
             # Create assistant message placeholder
             assistant_message = Message.create_assistant_message(
@@ -255,6 +276,8 @@ class ChatService:
             conversation.add_message(assistant_message)
             
             # Save conversation with complete assistant message
+            await user_turn_saved
+            user_turn_saved = None
             await self.chat_storage.save_conversation(conversation)
             
             # Send final message with metadata
@@ -284,6 +307,13 @@ class ChatService:
         except Exception as e:
             logger.error(f"Streaming message processing failed: {e}")
             raise MessageProcessingError(f"Failed to process streaming message: {str(e)}")
+        finally:
+            # Settle the user-turn save before an error reaches the caller
+            if user_turn_saved is not None:
+                try:
+                    await user_turn_saved
+                except Exception as e:
+                    logger.error(f"Failed to save user message: {e}")
     
     async def get_conversation_history(self, conversation_id: str) -> List[Message]:
         """
@@ -374,6 +404,19 @@ class ChatService:
             # Combine with current message
             full_query = f"{context_text}\n\nUser: {message}"
             
+            # Serve repeated queries over the same documents from cache
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = ResponseCache.make_key(
+                    full_query,
+                    self.rag_engine.resolve_query_params("hybrid", None, document_ids),
+                    document_ids
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("RAG query served from response cache")
+                    return cached
+            
             # Execute RAG query
             result = await self.rag_engine.query(
                 query=full_query,
@@ -386,6 +429,9 @@ class ChatService:
             # Extract sources from RAG result
             sources = self._extract_rag_sources(result, document_ids)
             
+            if cache_key is not None and result.get("success") and "response" in result:
+                self.response_cache.set(cache_key, response_content, sources)
+            
             logger.debug(f"RAG query completed: {len(response_content)} chars, {len(sources)} sources")
             return response_content, sources
             
@@ -439,16 +485,14 @@ class ChatService:
             task = await self.agent_orchestrator.submit_task(task_request)
             
             # Wait for task completion (with timeout)
-            import asyncio
             max_wait_time = 30  # 30 seconds timeout
-            start_time = asyncio.get_event_loop().time()
-            
-            while task.status.value in ["pending", "running"]:
-                if asyncio.get_event_loop().time() - start_time > max_wait_time:
-                    raise Exception("Agent task timeout")
-                
-                await asyncio.sleep(0.5)
-                task = await self.agent_orchestrator.get_task_status(task.id)
+            try:
+                task = await asyncio.wait_for(
+                    self.agent_orchestrator.await_task(task.id),
+                    timeout=max_wait_time
+                )
+            except asyncio.TimeoutError:
+                raise Exception("Agent task timeout")
             
             if task.status.value == "failed":
                 raise Exception(f"Agent task failed: {task.error}")
@@ -467,58 +511,66 @@ class ChatService:
             logger.error(f"Agent processing failed: {e}")
             return "I'm sorry, I couldn't process your request with the selected agent.", []
     
+    def _save_user_turn(self, conversation: Conversation, is_new: bool) -> Awaitable[None]:
+        """
+        Persist conversation after the user message is added
+        
+        New conversations get a full save so they are indexed immediately;
+        existing ones only rewrite their messages, since the save after the
+        assistant reply updates the index anyway.
+        """
+        if is_new:
+            return self.chat_storage.save_conversation(conversation)
+        return self.chat_storage.checkpoint_conversation(conversation)
+    
     def _build_conversation_context(self, messages: List[Message]) -> str:
         """Build conversation context from message history"""
-        if not messages:
-            return ""
-        
-        context_parts = []
-        for msg in messages[-10:]:  # Last 10 messages
-            role = "User" if msg.role == MessageRole.USER else "Assistant"
-            context_parts.append(f"{role}: {msg.content}")
-        
-        return "\n".join(context_parts)
+        # Last 10 messages; callers usually pass exactly that many already
+        if len(messages) > 10:
+            messages = messages[-10:]
+        
+        return "\n".join(
+            f"{'User' if msg.role == MessageRole.USER else 'Assistant'}: {msg.content}"
+            for msg in messages
+        )
     
     def _extract_rag_sources(self, rag_result: dict, document_ids: Optional[List[str]]) -> List[Source]:
         """Extract sources from RAG result"""
-        sources = []
-        
         # RAG engine doesn't provide detailed source information
         # We'll create generic sources based on available documents
-        if document_ids:
-            for doc_id in document_ids:
-                sources.append(Source(
-                    document_id=doc_id,
-                    document_name=f"Document {doc_id[:8]}",
-                    confidence=0.8
-                ))
-        
-        return sources
+        return self._document_sources(document_ids)
     
     def _extract_agent_sources(self, agent_result: dict, document_ids: Optional[List[str]]) -> List[Source]:
         """Extract sources from agent result"""
-        sources = []
-        
         # Agent results may include source information
         if "sources" in agent_result:
-            for src_data in agent_result["sources"]:
-                sources.append(Source(
+            return [
+                Source(
                     document_id=src_data.get("document_id", ""),
                     document_name=src_data.get("document_name", "Unknown"),
                     page_number=src_data.get("page_number"),
                     confidence=src_data.get("confidence"),
                     excerpt=src_data.get("excerpt")
-                ))
-        elif document_ids:
-            # Fallback to document IDs
-            for doc_id in document_ids:
-                sources.append(Source(
-                    document_id=doc_id,
-                    document_name=f"Document {doc_id[:8]}",
-                    confidence=0.8
-                ))
-        
-        return sources
+                )
+                for src_data in agent_result["sources"]
+            ]
+        
+        # Fallback to document IDs
+        return self._document_sources(document_ids)
+    
+    def _document_sources(self, document_ids: Optional[List[str]]) -> List[Source]:
+        """Build generic sources for the given document IDs"""
+        if not document_ids:
+            return []
+        
+        return [
+            Source(
+                document_id=doc_id,
+                document_name=f"Document {doc_id[:8]}",
+                confidence=0.8
+            )
+            for doc_id in document_ids
+        ]
     
     def _determine_task_type(self, agent_id: str, message: str) -> str:
         """
@@ -621,8 +673,8 @@ class ChatService:
     def _generate_conversation_title(self, first_message: str) -> str:
         """Generate conversation title from first message"""
         # Simple title generation - take first 50 chars
-        title = first_message.strip()[:50]
-        if len(first_message.strip()) > 50:
-            title += "..."
+        stripped = first_message.strip()
+        if len(stripped) > 50:
+            return stripped[:50] + "..."
         
-        return title or "New Conversation"
+        return stripped or "New Conversation"
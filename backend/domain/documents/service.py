@@ -72,7 +72,8 @@ class DocumentService:
         rag_engine: 'RAGEngine',
         document_registry: 'DocumentRegistry',
         max_file_size_mb: int = 50,
-        ocr_service: Optional['OCRService'] = None
+        ocr_service: Optional['OCRService'] = None,
+        on_corpus_changed: Optional[Callable[[], None]] = None
     ):
         """
         Initialize document service
@@ -82,12 +83,14 @@ class DocumentService:
             document_registry: Document metadata registry
             max_file_size_mb: Maximum file size in MB
             ocr_service: Optional OCR service for fallback processing
+            on_corpus_changed: Called after documents are added or deleted
         """
         self.rag_engine = rag_engine
         self.registry = document_registry
         self.max_file_size_mb = max_file_size_mb
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
         self.ocr_service = ocr_service
+        self.on_corpus_changed = on_corpus_changed
     
     async def upload_document(
         self,
@@ -255,6 +258,7 @@ class DocumentService:
                 lightrag_doc_id = await self.rag_engine.insert(extracted_content)
                 # Store the mapping in registry
                 await self.registry.store_lightrag_doc_id(document.id, lightrag_doc_id)
+                self._notify_corpus_changed()
                 
             finally:
                 # Always cancel rotation task
@@ -492,9 +496,16 @@ class DocumentService:
         if hard_delete:
             logger.warning(f"Hard delete requested but LightRAG content remains: {document_id}")
         
+        self._notify_corpus_changed()
+        
         logger.info(f"Document deleted: {document_id} (hard={hard_delete})")
         return True
     
+    def _notify_corpus_changed(self) -> None:
+        """Notify listener that the document corpus changed"""
+        if self.on_corpus_changed is not None:
+            self.on_corpus_changed()
+    
     async def query_documents(
         self,
         query_text: str,
@@ -43,6 +43,8 @@ class SubscriptionService:
         self.usage_tracker = usage_tracker
         self.license_validator = license_validator
         self.notification_service = notification_service
+        # Bumped on every subscription write so callers can cache derived values
+        self.version = 0
     
     def get_current_subscription(self) -> SubscriptionSettings:
         """
@@ -109,6 +111,7 @@ class SubscriptionService:
             # Update subscription
             settings.subscription = new_subscription
             await self.settings_storage.save_settings(settings)
+            self.version += 1
             
             # Record tier change in usage tracker
             await self.usage_tracker.record_tier_change(
@@ -275,6 +278,7 @@ class SubscriptionService:
         
         # Save updated settings
         await self.settings_storage.save_settings(settings)
+        self.version += 1
         
         logger.info(f"Tier transition complete: {old_tier} -> {new_tier}")
     
@@ -429,6 +433,7 @@ class SubscriptionService:
         # Features are now computed from tier - no need to store them
         
         await self.settings_storage.save_settings(settings)
+        self.version += 1
         
         logger.info(f"Trial period initialized: {trial_duration} days from {now.isoformat()}")
         
@@ -443,7 +448,7 @@ class SubscriptionService:
     async def _delete_hidden_documents(self) -> None:
         """Delete documents beyond first 3 (called on paid_limited -> free transition)"""
         try:
-            from core.dependencies import get_document_service
+            from core.dependencies import get_document_service, clear_chat_response_cache
             from infrastructure.storage.document_registry import DocumentRegistry
             
             # Get document service
@@ -463,6 +468,10 @@ class SubscriptionService:
                 except Exception as e:
                     logger.error(f"Failed to delete document {doc.id}: {e}")
             
+            if docs_to_delete:
+                # Cached chat answers may cite the removed documents
+                clear_chat_response_cache()
+            
             logger.info(f"Deleted {len(docs_to_delete)} hidden documents")
             
         except Exception as e:
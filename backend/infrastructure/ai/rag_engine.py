@@ -471,31 +471,20 @@ class RAGEngine:
         
         try:
             # Smart Mode Selection Logic
+            params = self.resolve_query_params(mode, top_k, document_ids)
+            effective_mode = params["search_mode"]
+            query_mode = params["query_mode"]
+            effective_top_k = params["top_k"]
+            use_reranking = params["use_reranking"]
+            
             if document_ids:
-                # Document-specific → FORCE naive mode for 95%+ isolation
-                effective_mode = "naive"
                 self.logger.info(f"Document-specific query detected: {len(document_ids)} docs → FORCING NAIVE mode")
             else:
-                # Global query → use configured mode
-                effective_mode = mode or getattr(self, 'search_mode', 'hybrid')
                 self.logger.info(f"Global query → using configured mode: {effective_mode}")
             
-            effective_top_k = top_k or getattr(self, 'top_k', 5)
-            # Cap top_k to avoid heavy queries that can cause timeouts
-            if effective_top_k > 20:
-                self.logger.warning(f"Reducing top_k from {effective_top_k} to 20 to avoid timeouts")
-                effective_top_k = 20
-            use_reranking = getattr(self, 'use_reranking', True)
-            
-            # Use "mix" mode when reranking is available (LightRAG recommendation)
-            # Mix mode integrates knowledge graph + vector retrieval + reranking
-            # BUT only for global queries (not document-specific)
-            if document_ids:
-                # Document-specific queries use naive mode (no graph traversal)
-                query_mode = "naive"
-            else:
-                # Global queries can use enhanced modes
-                query_mode = "mix" if (effective_mode == "hybrid" and self._rag.rerank_model_func and use_reranking) else effective_mode
+            requested_top_k = top_k or getattr(self, 'top_k', 5)
+            if requested_top_k > effective_top_k:
+                self.logger.warning(f"Reducing top_k from {requested_top_k} to {effective_top_k} to avoid timeouts")
             
             # Optional document scoping via chunk IDs
             ids_param = None
@@ -617,29 +606,20 @@ class RAGEngine:
         
         try:
             # Smart Mode Selection Logic (same as query method)
+            params = self.resolve_query_params(mode, top_k, document_ids)
+            effective_mode = params["search_mode"]
+            query_mode = params["query_mode"]
+            effective_top_k = params["top_k"]
+            use_reranking = params["use_reranking"]
+            
             if document_ids:
-                # Document-specific → FORCE naive mode for 95%+ isolation
-                effective_mode = "naive"
                 self.logger.info(f"Document-specific streaming query detected: {len(document_ids)} docs → FORCING NAIVE mode")
             else:
-                # Global query → use configured mode
-                effective_mode = mode or getattr(self, 'search_mode', 'hybrid')
                 self.logger.info(f"Global streaming query → using configured mode: {effective_mode}")
             
-            effective_top_k = top_k or getattr(self, 'top_k', 5)
-            if effective_top_k > 20:
-                self.logger.warning(f"Reducing streaming top_k from {effective_top_k} to 20 to avoid timeouts")
-                effective_top_k = 20
-            use_reranking = getattr(self, 'use_reranking', True)
-            
-            # Use "mix" mode when reranking is available
-            # BUT only for global queries (not document-specific)
-            if document_ids:
-                # Document-specific queries use naive mode (no graph traversal)
-                query_mode = "naive"
-            else:
-                # Global queries can use enhanced modes
-                query_mode = "mix" if (effective_mode == "hybrid" and self._rag.rerank_model_func and use_reranking) else effective_mode
+            requested_top_k = top_k or getattr(self, 'top_k', 5)
+            if requested_top_k > effective_top_k:
+                self.logger.warning(f"Reducing streaming top_k from {requested_top_k} to {effective_top_k} to avoid timeouts")
             
             # Apply language-specific processing if needed
             effective_language = self.get_effective_language(query)
@@ -884,6 +864,48 @@ class RAGEngine:
             # Return original result if filtering fails
             return result
 
+    def resolve_query_params(
+        self,
+        mode: Optional[str] = None,
+        top_k: Optional[int] = None,
+        document_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Resolve effective query parameters from arguments and applied settings
+        
+        Args:
+            mode: Requested query mode - uses settings if None
+            top_k: Requested number of results - uses settings if None
+            document_ids: Optional document scope
+            
+        Returns:
+            Dictionary with search_mode, query_mode, top_k, use_reranking,
+            llm_model and agent_language
+        """
+        use_reranking = getattr(self, 'use_reranking', True)
+        
+        if document_ids:
+            # Document-specific → FORCE naive mode for 95%+ isolation
+            # (no graph traversal)
+            effective_mode = "naive"
+            query_mode = "naive"
+        else:
+            # Global query → use configured mode; "mix" when reranking is
+            # available (LightRAG recommendation: graph + vector + rerank)
+            effective_mode = mode or getattr(self, 'search_mode', 'hybrid')
+            rerank_func = self._rag.rerank_model_func if self._rag else None
+            query_mode = "mix" if (effective_mode == "hybrid" and rerank_func and use_reranking) else effective_mode
+        
+        return {
+            "search_mode": effective_mode,
+            "query_mode": query_mode,
+            # Cap top_k to avoid heavy queries that can cause timeouts
+            "top_k": min(top_k or getattr(self, 'top_k', 5), 20),
+            "use_reranking": use_reranking,
+            "llm_model": self.user_settings.get("rag", {}).get("llm_model", "gpt-4o-mini"),
+            "agent_language": getattr(self, 'agent_language', 'auto')
+        }
+    
     def apply_settings(self, settings: Dict[str, Any]) -> None:
         """
         Apply user settings to RAG engine
@@ -4,12 +4,14 @@ All storage implementations
 """
 from infrastructure.storage.analytics_storage import AnalyticsStorage
 from infrastructure.storage.document_registry import DocumentRegistry
+from infrastructure.storage.extraction_cache import ExtractionCache
 from infrastructure.storage.file_storage import FileStorage
 from infrastructure.storage.lightrag_storage import LightRAGStorage
 
 __all__ = [
     "AnalyticsStorage",
     "DocumentRegistry",
+    "ExtractionCache",
     "FileStorage",
     "LightRAGStorage"
 ]
\ No newline at end of file
@@ -4,6 +4,7 @@ JSON-based storage for document analytics metadata
 """
 import json
 import logging
+from collections import Counter
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from datetime import datetime
@@ -215,32 +216,28 @@ class AnalyticsStorage:
         """
         docs = await self.get_all_documents()
         
-        summary = {
-            "total_documents": len(docs),
-            "by_category": {},
-            "by_language": {},
-            "confirmed": 0,
-            "pending_confirmation": 0
-        }
+        by_category: Counter = Counter()
+        by_language: Counter = Counter()
+        confirmed = 0
         
         for doc in docs.values():
             classification = doc.get("classification", {})
             
-            # Count by category
-            category = classification.get("category", "Unclassified")
-            summary["by_category"][category] = summary["by_category"].get(category, 0) + 1
-            
-            # Count by language
-            language = classification.get("detected_language", "unknown")
-            summary["by_language"][language] = summary["by_language"].get(language, 0) + 1
+            # Count by category and language
+            by_category[classification.get("category", "Unclassified")] += 1
+            by_language[classification.get("detected_language", "unknown")] += 1
             
             # Confirmation status
             if classification.get("user_confirmed", False):
-                summary["confirmed"] += 1
-            else:
-                summary["pending_confirmation"] += 1
+                confirmed += 1
         
-        return summary
+        return {
+            "total_documents": len(docs),
+            "by_category": dict(by_category),
+            "by_language": dict(by_language),
+            "confirmed": confirmed,
+            "pending_confirmation": len(docs) - confirmed
+        }
     
     async def delete_document(self, document_id: str) -> bool:
         """
@@ -2,8 +2,10 @@
 Chat Storage
 Conversation persistence using JSON files
 """
+import asyncio
 import json
 import logging
+import os
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
@@ -27,11 +29,24 @@ class ChatStorage:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.index_file = self.storage_dir / "conversations_index.json"
         self.logger = logging.getLogger(__name__)
+        # Serializes index read-modify-write across saves and deletes
+        self._lock = asyncio.Lock()
     
     def _get_conversation_file(self, conversation_id: str) -> Path:
         """Get file path for conversation"""
         return self.storage_dir / f"{conversation_id}.json"
     
+    def _write_json(self, path: Path, data: dict) -> None:
+        """Write JSON file atomically so readers never see a partial file"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def _load_index(self) -> dict:
         """Load conversations index"""
         try:
@@ -48,8 +63,7 @@ class ChatStorage:
         """Save conversations index"""
         try:
             index_data["last_updated"] = datetime.utcnow().isoformat()
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
+            self._write_json(self.index_file, index_data)
         except Exception as e:
             self.logger.error(f"Failed to save conversations index: {e}")
             raise StorageError(f"Failed to save conversations index: {str(e)}")
@@ -118,43 +132,56 @@ class ChatStorage:
         
         return conversation
     
+    def _write_conversation_file(self, conversation_data: dict) -> None:
+        """Write conversation file (blocking)"""
+        self._write_json(
+            self._get_conversation_file(conversation_data["id"]),
+            conversation_data
+        )
+    
+    def _write_conversation(self, conversation_data: dict, index_entry: dict) -> None:
+        """Write conversation file and update index entry (blocking)"""
+        self._write_conversation_file(conversation_data)
+        
+        # Update index
+        index_data = self._load_index()
+        conversations = index_data.get("conversations", [])
+        
+        # Remove existing entry if present
+        conversations = [c for c in conversations if c["id"] != index_entry["id"]]
+        
+        # Add new entry
+        conversations.append(index_entry)
+        
+        # Sort by updated_at descending
+        conversations.sort(key=lambda x: x["updated_at"], reverse=True)
+        index_data["conversations"] = conversations
+        
+        self._save_index(index_data)
+    
     async def save_conversation(self, conversation: Conversation) -> None:
         """
         Save conversation to storage
         
+        The conversation is snapshotted before this coroutine first yields,
+        so callers may keep mutating it while the write runs off the event loop.
+        
         Args:
             conversation: Conversation to save
         """
         try:
-            # Save conversation file
-            conversation_file = self._get_conversation_file(conversation.id)
             conversation_data = self._conversation_to_dict(conversation)
-            
-            with open(conversation_file, 'w', encoding='utf-8') as f:
-                json.dump(conversation_data, f, indent=2, ensure_ascii=False)
-            
-            # Update index
-            index_data = self._load_index()
-            conversations = index_data.get("conversations", [])
-            
-            # Remove existing entry if present
-            conversations = [c for c in conversations if c["id"] != conversation.id]
-            
-            # Add new entry
-            conversations.append({
+            index_entry = {
                 "id": conversation.id,
                 "title": conversation.title,
-                "created_at": conversation.created_at.isoformat(),
-                "updated_at": conversation.updated_at.isoformat(),
+                "created_at": conversation_data["created_at"],
+                "updated_at": conversation_data["updated_at"],
                 "message_count": len(conversation.messages),
                 "last_message_preview": conversation.messages[-1].content[:100] if conversation.messages else None
-            })
-            
-            # Sort by updated_at descending
-            conversations.sort(key=lambda x: x["updated_at"], reverse=True)
-            index_data["conversations"] = conversations
+            }
             
-            self._save_index(index_data)
+            async with self._lock:
+                await asyncio.to_thread(self._write_conversation, conversation_data, index_entry)
             
             self.logger.info(f"Saved conversation: {conversation.id}")
             
@@ -165,6 +192,31 @@ class ChatStorage:
                 conversation_id=conversation.id
             )
     
+    async def checkpoint_conversation(self, conversation: Conversation) -> None:
+        """
+        Write conversation messages without updating the index
+        
+        Used for intermediate writes of an already indexed conversation;
+        the next save_conversation refreshes its index entry.
+        
+        Args:
+            conversation: Conversation to write
+        """
+        try:
+            conversation_data = self._conversation_to_dict(conversation)
+            
+            async with self._lock:
+                await asyncio.to_thread(self._write_conversation_file, conversation_data)
+            
+            self.logger.debug(f"Checkpointed conversation: {conversation.id}")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to checkpoint conversation: {e}")
+            raise ConversationStorageError(
+                f"Failed to checkpoint conversation: {str(e)}",
+                conversation_id=conversation.id
+            )
+    
     async def load_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """
         Load conversation from storage
@@ -242,15 +294,16 @@ class ChatStorage:
                 self.logger.warning(f"Conversation not found for deletion: {conversation_id}")
                 return False
             
-            # Delete conversation file
-            conversation_file.unlink()
-            
-            # Update index
-            index_data = self._load_index()
-            conversations = index_data.get("conversations", [])
-            conversations = [c for c in conversations if c["id"] != conversation_id]
-            index_data["conversations"] = conversations
-            self._save_index(index_data)
+            async with self._lock:
+                # Delete conversation file
+                conversation_file.unlink()
+                
+                # Update index
+                index_data = self._load_index()
+                conversations = index_data.get("conversations", [])
+                conversations = [c for c in conversations if c["id"] != conversation_id]
+                index_data["conversations"] = conversations
+                self._save_index(index_data)
             
             self.logger.info(f"Deleted conversation: {conversation_id}")
             return True
@@ -0,0 +1,133 @@
+"""
+Extraction Cache
+Content-addressed, encrypted cache for parsed metadata extraction results
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from core.config import get_settings
+from core.security import get_api_key_manager
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """
+    On-disk cache for per-chunk extraction results
+    Entries hold contract data, so they are encrypted with the machine key and
+    stored as {key[:2]}/{key}.enc under the cache directory; once more than
+    max_entries exist the least recently written ones are evicted
+    """
+    
+    MAX_ENTRIES = 5000
+    
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = MAX_ENTRIES
+    ):
+        """
+        Initialize extraction cache
+        
+        Args:
+            cache_dir: Cache directory (defaults to <working_dir>/analytics_cache)
+            max_entries: Maximum entries kept on disk before eviction
+        """
+        if cache_dir is None:
+            cache_dir = Path(get_settings().storage.working_dir) / "analytics_cache"
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self._key_manager = get_api_key_manager()
+        # Entry count is taken from disk on first write, then tracked in memory
+        self._entry_count: Optional[int] = None
+        self._count_lock = threading.Lock()
+    
+    def _entry_path(self, key: str) -> Path:
+        """Get file path for cache key"""
+        return self.cache_dir / key[:2] / f"{key}.enc"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached extraction result
+        
+        Args:
+            key: Content hash key
+        
+        Returns:
+            Cached result or None on miss
+        """
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                return self._key_manager.decrypt_settings(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read extraction cache entry {key}: {e}")
+            return None
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store extraction result
+        
+        Args:
+            key: Content hash key
+            value: Parsed extraction result
+        """
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not path.exists()
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self._key_manager.encrypt_settings(value))
+            # Atomic swap so concurrent readers never see a partial entry
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write extraction cache entry {key}: {e}")
+            return
+        
+        if is_new:
+            self._track_new_entry()
+    
+    def _track_new_entry(self) -> None:
+        """Count a newly written entry and evict the oldest once over the cap"""
+        with self._count_lock:
+            if self._entry_count is None:
+                self._remove_plaintext_entries()
+                self._entry_count = sum(1 for _ in self.cache_dir.glob("*/*.enc"))
+            else:
+                self._entry_count += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+    
+    def _remove_plaintext_entries(self) -> None:
+        """Delete unencrypted entries written by earlier releases"""
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+    
+    def _evict(self) -> None:
+        """Remove the least recently written entries down to 90% of the cap"""
+        entries = []
+        for path in self.cache_dir.glob("*/*.enc"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        entries.sort()
+        
+        excess = len(entries) - int(self.max_entries * 0.9)
+        removed = 0
+        for _, path in entries[:max(excess, 0)]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        self._entry_count = len(entries) - removed
+        logger.info(f"Evicted {removed} extraction cache entries")
@@ -753,11 +753,19 @@ class UsageTracker:
             Analytics based on actual conversations
         """
         try:
-            from core.dependencies import get_chat_service
+            from core.config import get_settings
+            from core.dependencies import (
+                get_chat_service, get_chat_storage, get_chat_response_cache
+            )
             from datetime import datetime, timedelta
             
             # Get chat service
-            chat_service = get_chat_service()
+            settings = get_settings()
+            chat_service = await get_chat_service(
+                chat_storage=await get_chat_storage(settings),
+                response_cache=await get_chat_response_cache(),
+                settings=settings
+            )
             conversations = await chat_service.list_conversations()
             
             # Filter conversations from last N days
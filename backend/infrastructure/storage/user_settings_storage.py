@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 
 from api.schemas.settings import UserSettings
 from core.config import get_settings
-from core.security import APIKeyManager
+from core.security import get_api_key_manager
 from core.exceptions import StorageError
 
 logger = logging.getLogger(__name__)
@@ -26,7 +26,7 @@ class UserSettingsStorage:
         """Initialize settings storage"""
         self.settings = get_settings()
         self.storage_path = self.settings.storage.working_dir / "user_settings.json"
-        self.api_key_manager = APIKeyManager()
+        self.api_key_manager = get_api_key_manager()
         
         # Ensure storage directory exists
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
@@ -42,6 +42,14 @@ hiddenimports += [
     'uvicorn.lifespan.on',
 ]
 
+# Exception submodules loaded lazily by core.exceptions.__getattr__
+hiddenimports += [
+    'core.exceptions.documents',
+    'core.exceptions.analytics',
+    'core.exceptions.agents',
+    'core.exceptions.integrations',
+]
+
 # Analysis
 a = Analysis(
     ['main.py'],
@@ -0,0 +1,57 @@
+"""
+Dependency Wiring Tests
+"""
+import pytest
+from unittest.mock import MagicMock
+
+import core.dependencies as dependencies
+from domain.chat.response_cache import ResponseCache
+from domain.chat.service import ChatService
+
+
+class _FakeUserSettings:
+    def model_dump(self):
+        return {}
+
+
+class _FakeUserSettingsStorage:
+    async def load_settings(self):
+        return _FakeUserSettings()
+
+
+@pytest.fixture
+def rag_ready(monkeypatch):
+    """Register a RAG engine and reset the singletons built on top of it"""
+    monkeypatch.setattr(dependencies, "_rag_engine_instance", MagicMock())
+    monkeypatch.setattr(dependencies, "_document_registry", MagicMock())
+    monkeypatch.setattr(dependencies, "_extraction_cache", MagicMock())
+    monkeypatch.setattr(dependencies, "_agent_data_access", None)
+    monkeypatch.setattr(dependencies, "UserSettingsStorage", _FakeUserSettingsStorage)
+
+
+@pytest.mark.asyncio
+async def test_get_chat_service_with_rag_engine(rag_ready, mock_settings):
+    service = await dependencies.get_chat_service(
+        chat_storage=MagicMock(),
+        response_cache=ResponseCache(),
+        settings=mock_settings
+    )
+
+    assert isinstance(service, ChatService)
+    assert service.rag_engine is dependencies._rag_engine_instance
+    assert service.document_service is not None
+    assert service.agent_orchestrator is not None
+
+
+@pytest.mark.asyncio
+async def test_get_chat_service_without_api_key_skips_agents(rag_ready, mock_settings):
+    mock_settings.openai.api_key = None
+
+    service = await dependencies.get_chat_service(
+        chat_storage=MagicMock(),
+        response_cache=ResponseCache(),
+        settings=mock_settings
+    )
+
+    assert service.rag_engine is dependencies._rag_engine_instance
+    assert service.agent_orchestrator is None